@@ -0,0 +1,6 @@
+"""
+	Makes plain pytest run from project folder find screensavers package:
+	pytest inserts folder of this file into sys.path before collecting tests.
+
+	Tests also run with: python -m unittest discover tests
+"""
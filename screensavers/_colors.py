@@ -0,0 +1,79 @@
+"""
+	Gradient colors shared by screensavers.
+
+	gradient(start, finish, n) returns n colors from start to finish
+	both as '#rrggbb' strings for Tk and as packed 0xRRGGBB integers.
+	Results are memoised by (start, finish, n), so screensavers which
+	rebuild their colors on every init (resize, timer) get them for free.
+	Returned colors are tuples as they are shared between callers.
+
+	Example usage: to get 30 colors which make gradient from '#1A1BA2' to '#AA2BE2':
+
+		colors = gradient('#1A1BA2', '#AA2BE2', 30).hex
+
+	Note: this is not a screensaver module, so its name starts with underscore.
+
+	@2026_10_18 by Beotiger & co.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+# Colors of a gradient as '#rrggbb' strings and as 0xRRGGBB integers
+Gradient = namedtuple('Gradient', ['hex', 'packed'])
+
+class GradientColor:
+	"""This static class let us create gradient colors lists.
+		All colors must be strings in '#RRGGBB' format"""
+	@staticmethod
+	def hex_to_RGB(hex):
+		""" '#FFFFFF' -> [255,255,255] """
+		# Pass 16 to the integer function for change of base
+		return [int(hex[i:i+2], 16) for i in range(1, 6, 2)]
+
+	@staticmethod
+	def RGB_to_hex(RGB):
+		""" [255,255,255] -> '#FFFFFF' """
+		# Components need to be integers for hex to make sense
+		RGB = [int(x) for x in RGB]
+		return "#"+"".join(["0{0:x}".format(v) if v < 16 else
+							"{0:x}".format(v) for v in RGB])
+
+	@staticmethod
+	def color_dict(gradient):
+		"""Takes in a list of RGB sub-lists and returns dictionary of
+			colors in RGB and hex form for use in a graphing function
+			defined later on"""
+		return {"hex":[GradientColor.RGB_to_hex(RGB) for RGB in gradient],
+				"r":[RGB[0] for RGB in gradient],
+				"g":[RGB[1] for RGB in gradient],
+				"b":[RGB[2] for RGB in gradient]}
+
+	@staticmethod
+	def linear_gradient(start_hex, finish_hex="#FFFFFF", n=10):
+		"""Returns a gradient list of (n) colors between
+			two hex colors. start_hex and finish_hex
+			should be the full six-digit color string,
+			inlcuding the number sign ("#FFFFFF")"""
+		# Starting and ending colors in RGB form
+		s = GradientColor.hex_to_RGB(start_hex)
+		f = GradientColor.hex_to_RGB(finish_hex)
+		# Initilize a list of the output colors with the starting color
+		RGB_list = [s]
+		# Calcuate a color at each evenly spaced value of t from 1 to n
+		for t in range(1, n):
+			# Interpolate RGB vector for color at the current value of t
+			curr_vector = [
+				int(s[j] + (float(t)/(n-1))*(f[j]-s[j]))
+				for j in range(3)
+			]
+			# Add it to our list of output colors
+			RGB_list.append(curr_vector)
+		return GradientColor.color_dict(RGB_list)
+
+@lru_cache(maxsize=None)
+def gradient(start_hex, finish_hex="#FFFFFF", n=10):
+	"""Return Gradient of (n) colors from start_hex to finish_hex"""
+	colors = GradientColor.linear_gradient(start_hex, finish_hex, n)
+	packed = [(r << 16) | (g << 8) | b for r, g, b in zip(colors['r'], colors['g'], colors['b'])]
+	return Gradient(tuple(colors['hex']), tuple(packed))
@@ -0,0 +1,160 @@
+"""
+	Glyph atlas shared by screensavers which draw lots of symbols
+	(matrix.py and crazychars.py for now).
+
+	Every (character, color, size) combination is rasterised only once
+	into a PhotoImage and then can be drawn with canvas create_image
+	or switched with itemconfigure(image=...) without Tk font shaping
+	of text items on every create or configure.
+
+	Rasterising needs Pillow (https://python-pillow.org) and a font file
+	with katakana glyphs. Font file can be given by its name or full path,
+	otherwise the first of FONT_FILES found in application folders or in
+	system fonts folders of current platform is used. When Pillow or font file
+	is not available atlas is not available too (it is logged as a warning)
+	and screensavers should use ordinary text items.
+
+	Note: this is not a screensaver module, so its name starts with underscore.
+
+	@2026_10_18 by Beotiger & co.
+"""
+
+import os
+import sys
+import pathlib
+import logging
+from collections import OrderedDict
+from functools import lru_cache
+try:
+	from PIL import Image, ImageDraw, ImageFont, ImageTk
+except ImportError:
+	# Pillow is optional: without it there is no glyph atlas
+	Image = None
+
+logger = logging.getLogger(__name__)
+
+# Application folders where font file can be put besides system fonts folders
+FONT_DIRS = [
+	pathlib.Path(__file__).parent.parent.resolve(),
+	pathlib.Path(getattr(sys, '_MEIPASS', '.')).resolve()
+]
+
+# Font files with katakana glyphs in order of preference. The first one is
+# bundled with compiled application (see tkscrsavers.spec), then go Windows(tm),
+# macOS and Linux fonts. Names are compared case insensitively
+FONT_FILES = [
+	'MS Mincho.ttf',
+	'msmincho.ttc', 'msgothic.ttc', 'YuGothR.ttc', 'meiryo.ttc',
+	'ヒラギノ明朝 ProN.ttc', 'ヒラギノ角ゴシック W3.ttc', 'Hiragino Sans GB.ttc', 'Arial Unicode.ttf',
+	'NotoSerifCJK-Regular.ttc', 'NotoSansCJK-Regular.ttc', 'ipam.ttf', 'ipag.ttf',
+	'fonts-japanese-mincho.ttf', 'fonts-japanese-gothic.ttf', 'DroidSansFallbackFull.ttf'
+]
+
+def systemFontDirs():
+	"""Return system fonts folders of current platform"""
+	if sys.platform == 'win32':
+		return [os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+			os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts')]
+	if sys.platform == 'darwin':
+		return ['/System/Library/Fonts', '/System/Library/Fonts/Supplemental', '/Library/Fonts',
+			os.path.expanduser('~/Library/Fonts')]
+	dataDirs = os.environ.get('XDG_DATA_DIRS') or '/usr/local/share:/usr/share'
+	return [os.path.join(d, 'fonts') for d in dataDirs.split(':') if d] + \
+		[os.path.expanduser('~/.local/share/fonts'), os.path.expanduser('~/.fonts')]
+
+@lru_cache(maxsize=None)
+def findFont(name=None):
+	"""Return path of font file @name (file name or full path) or,
+		when @name is not given, of the first FONT_FILES one found. Return None if there is no such file"""
+	if name and os.path.isfile(name): return name
+	# File names in application folders and in system fonts folders with their subfolders
+	files = {}
+	for d in FONT_DIRS:
+		if os.path.isdir(d):
+			for f in os.listdir(d): files.setdefault(f.lower(), os.path.join(d, f))
+	for d in systemFontDirs():
+		for root, dirs, names in os.walk(d):
+			for f in names: files.setdefault(f.lower(), os.path.join(root, f))
+	for f in [os.path.basename(name)] if name else FONT_FILES:
+		if f.lower() in files: return files[f.lower()]
+	logger.warning('Font file %s is not found, symbols are drawn as text items', name or 'with katakana glyphs')
+	return None
+
+class GlyphAtlas:
+	"""Cache of rasterised glyphs as PhotoImages keyed by (character, color, size).
+		Sizes are in points as in Tk font descriptions"""
+	def __init__(self, master, family=None, bold=False, limit=None):
+		"""@master is a Tk widget which images belong to,
+			@family is a font file name or path (None - look for FONT_FILES),
+			@bold emulates bold font by stroking glyphs,
+			@limit is number of glyphs to keep (None - no limit). Past it trim() drops
+				least recently used glyphs which are not shown by any canvas item"""
+		self.master = master
+		self.family = family
+		self.path = None
+		self.bold = bold
+		self.limit = limit
+		# Number of glyphs when to evict them next time
+		self.bound = limit
+		# Glyphs from least to most recently used
+		self.glyphs = OrderedDict()
+		# Loaded fonts by size in points, None if font can not be loaded
+		self.fonts = {}
+		self.scale = None
+
+	def font(self, size):
+		"""Return Pillow font for @size in points or None if font is not available"""
+		if size not in self.fonts:
+			self.fonts[size] = None
+			if Image is None:
+				logger.warning('Pillow is not installed, symbols are drawn as text items')
+			else:
+				if self.path is None: self.path = findFont(self.family) or ''
+				if self.path:
+					# Tk font sizes are in points and Pillow ones are in pixels
+					if self.scale is None: self.scale = self.master.winfo_fpixels('1p')
+					pixels = max(round(size * self.scale), 1)
+					try:
+						self.fonts[size] = ImageFont.truetype(self.path, pixels)
+					except OSError:
+						logger.warning('Can not load font file %s', self.path)
+		return self.fonts[size]
+
+	def available(self, size):
+		"""Can we rasterise glyphs of @size at all"""
+		return self.font(size) is not None
+
+	def get(self, char, color, size):
+		"""Return PhotoImage with @char in @color and @size.
+			It is drawn with its top left corner as in text item with anchor NW.
+			Return None when atlas is not available"""
+		key = (char, color, size)
+		glyph = self.glyphs.get(key)
+		if glyph is not None:
+			self.glyphs.move_to_end(key)
+		else:
+			font = self.font(size)
+			if font is None:
+				return None
+			ascent, descent = font.getmetrics()
+			stroke = 1 if self.bold else 0
+			width = max(int(font.getlength(char)) + stroke * 2, 1)
+			image = Image.new('RGBA', (width, ascent + descent + stroke * 2), (0, 0, 0, 0))
+			ImageDraw.Draw(image).text((stroke, stroke), char, font=font, fill=color,
+				stroke_width=stroke, stroke_fill=color)
+			glyph = self.glyphs[key] = ImageTk.PhotoImage(image, master=self.master)
+		return glyph
+
+	def trim(self):
+		"""When atlas is over its limit drop least recently used glyphs which are not in use
+			until quarter of limit is free. Glyphs shown by canvas items are kept (deleting them
+			would blank those items), so atlas can outgrow its limit while they are all on the screen.
+			Call it only when all glyphs got from the atlas are already given to canvas items"""
+		if self.bound is None or len(self.glyphs) < self.bound: return
+		keep = self.limit - self.limit // 4
+		for key in list(self.glyphs):
+			if len(self.glyphs) <= keep: break
+			if not self.master.tk.getboolean(self.master.tk.call('image', 'inuse', self.glyphs[key])):
+				del self.glyphs[key]
+		# Do not scan glyphs in use again on every new glyph
+		self.bound = max(self.limit, len(self.glyphs) + self.limit // 4)
@@ -0,0 +1,85 @@
+"""
+	Frame scheduler shared by screensavers.
+
+	Instead of sleeping fixed 25 ms after every frame (so frame time grows
+	with work done and animation slows down under load) scheduler measures
+	real elapsed time and runs simulation on a fixed timestep:
+	step(dt) is called once for every passed period of dt = 1 / fps seconds
+	and render() once after them. When a frame took too long several steps
+	are run before next render, i.e. frames are skipped, so animation speed
+	does not depend on CPU load. At most maxSkip frames are skipped at once,
+	the rest of the lag is dropped (e.g. after window was dragged or system slept).
+
+	Scheduler is the only loop screensavers have: Tk mainloop runs its timer
+	and handles all events between frames, so screensavers should not call
+	update() of their windows themselves.
+
+	tkscrsavers.py creates a scheduler for every screensaver window
+	and gives it to screensaver as scrsaver.scheduler. Test applications
+	create their own ones. Example usage:
+
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.animate.step, self.animate.render)
+		...
+		self.scheduler.stop()
+
+	Note: this is not a screensaver module, so its name starts with underscore.
+
+	@2026_10_18 by Beotiger & co.
+"""
+
+import math
+import time
+
+class Scheduler:
+	"""Run step/render callbacks on a Tk widget timer with a fixed timestep"""
+	def __init__(self, widget, fps=40, maxSkip=4):
+		"""@widget is a Tk widget which timer is used, scheduler stops when it is destroyed,
+			@fps is a number of simulation steps per second (40 is 25 ms step of old screensavers),
+			@maxSkip is maximum number of frames to skip at once (0 - never skip frames)"""
+		self.widget = widget
+		self.period = 1 / fps
+		self.maxSkip = maxSkip
+		self.step = self.render = None
+		self.afterId = None
+		self.widget.bind('<Destroy>', self.destroy, add='+')
+
+	def start(self, step, render=None):
+		"""Start calling @step(dt) on every timestep and @render() after steps of every frame.
+			When @render is None step is supposed to draw itself"""
+		self.stop()
+		self.step, self.render = step, render
+		self.last = time.perf_counter()
+		# Run first step at once
+		self.lag = self.period
+		self.afterId = self.widget.after_idle(self.tick)
+
+	def stop(self):
+		"""Stop calling callbacks"""
+		if self.afterId is not None:
+			self.widget.after_cancel(self.afterId)
+			self.afterId = None
+
+	def destroy(self, evt):
+		"""Event: widget or any of its children are destroyed"""
+		if evt.widget is self.widget: self.stop()
+
+	def tick(self):
+		"""Timer callback: run steps for elapsed time, render and schedule next frame"""
+		now = time.perf_counter()
+		self.lag += now - self.last
+		self.last = now
+		steps = int(self.lag / self.period)
+		if steps > self.maxSkip + 1:
+			steps = self.maxSkip + 1
+			self.lag = 0.0
+		else:
+			self.lag -= steps * self.period
+		# Callbacks may stop scheduler (e.g. by closing window), so check it on every call
+		for i in range(steps):
+			if self.afterId is None: return
+			self.step(self.period)
+		if steps and self.render is not None and self.afterId is not None: self.render()
+		if self.afterId is not None:
+			# Wait for the rest of current timestep, at least 1 ms to let Tk handle events
+			self.afterId = self.widget.after(max(math.ceil((self.period - self.lag) * 1000), 1), self.tick)
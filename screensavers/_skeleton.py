@@ -25,9 +25,15 @@
 """
 
 # Import needed libraries here, tkinter is a must obviously
-import random
 import math
 from tkinter import *
+# Shared gradient colors can be imported from _colors.py the same way as Scheduler,
+# e.g. gradient('#1A1BA2', '#AA2BE2', 30).hex is a tuple of 30 colors in '#rrggbb' format
+try:
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _scheduler import Scheduler
 
 # Default width and height of canvas when testing screensaver.
 # Adjust them to your needs
@@ -95,62 +101,6 @@ class Vector:
 	def __str__(self) -> str:
 		return f'V({round(self.x, 2)}, {round(self.y, 2)})'
 
-class GradientColor:
-	"""This static class let us create gradient colors lists.
-		To use it call GradientColor.linear_gradient(startColor, endColor, numberOfColor)
-		and get its ['hex'] component. All colors must be strings in '#RRGGBB' format.
-
-		Example usage: to get list consists of 30 colors in '#RRGGBB' format
-			which makes gradients from '#1A1BA2' to '#AA2BE2':
-
-			gradColorsList = GradientColor.linear_gradient('#1A1BA2', '#AA2BE2', 30)['hex']
-	"""
-	@staticmethod
-	def hex_to_RGB(hex):
-		""" '#FFFFFF' -> [255,255,255] """
-		# Pass 16 to the integer function for change of base
-		return [int(hex[i:i+2], 16) for i in range(1, 6, 2)]
-
-	@staticmethod
-	def RGB_to_hex(RGB):
-		""" [255,255,255] -> '#FFFFFF' """
-		# Components need to be integers for hex to make sense
-		RGB = [int(x) for x in RGB]
-		return "#"+"".join(["0{0:x}".format(v) if v < 16 else
-							"{0:x}".format(v) for v in RGB])
-
-	@staticmethod
-	def color_dict(gradient):
-		"""Takes in a list of RGB sub-lists and returns dictionary of
-			colors in RGB and hex form for use in a graphing function
-			defined later on"""
-		return {"hex":[GradientColor.RGB_to_hex(RGB) for RGB in gradient],
-				"r":[RGB[0] for RGB in gradient],
-				"g":[RGB[1] for RGB in gradient],
-				"b":[RGB[2] for RGB in gradient]}
-
-	@staticmethod
-	def linear_gradient(start_hex, finish_hex="#FFFFFF", n=10):
-		"""Returns a gradient list of (n) colors between
-			two hex colors. start_hex and finish_hex
-			should be the full six-digit color string,
-			inlcuding the number sign ("#FFFFFF")"""
-		# Starting and ending colors in RGB form
-		s = GradientColor.hex_to_RGB(start_hex)
-		f = GradientColor.hex_to_RGB(finish_hex)
-		# Initilize a list of the output colors with the starting color
-		RGB_list = [s]
-		# Calcuate a color at each evenly spaced value of t from 1 to n
-		for t in range(1, n):
-			# Interpolate RGB vector for color at the current value of t
-			curr_vector = [
-				int(s[j] + (float(t)/(n-1))*(f[j]-s[j]))
-				for j in range(3)
-			]
-			# Add it to our list of output colors
-			RGB_list.append(curr_vector)
-		return GradientColor.color_dict(RGB_list)
-
 class Main:
 	"""Main canvas class where all animation occurs"""
 	def __init__(self, canvas, options):
@@ -239,12 +189,22 @@ class Main:
 		...
 		"""
 
-	def update(self):
-		"""Main update routine"""
+	def step(self, dt):
+		"""Move animation forward by one timestep of @dt seconds.
+			Scheduler calls it with the same dt every time, several times in a row
+			when drawing falls behind, so only change animation state here
+			and leave drawing to render()"""
+		if self.running:
+			"""Do animation cycle here
+			...
+			"""
+
+	def render(self):
+		"""Draw current animation state. Called once after steps of every frame"""
 		if self.running:
 			# Clear canvas if needed
 			self.canvas.delete('all')
-			"""Do animation cycle here
+			"""Draw animation here
 			...
 			"""
 
@@ -270,6 +230,12 @@ class TkScreenSaver:
 			usually any key press or mouse move.
 			External events are binded in tkscrsavers.py before screensaver call.
 
+			scrsaver.scheduler runs animation frames on a fixed timestep
+			whatever time drawing takes (see _scheduler.py): it calls
+			Main.step(dt) and Main.render() from Tk mainloop, so screensaver
+			does not need its own loop and must not call root.update().
+			It should be stopped when screensaver finishes.
+
 			As a rule screensaver is called in full screen size
 			with mouse cusror hidden and without borders.
 		"""
@@ -283,17 +249,8 @@ class TkScreenSaver:
 		self.canvas.pack()
 		# Should give Main link to canvas for drawing and options to use
 		self.animate = Main(self.canvas, options)
-		self.run()
-
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move as a rule"""
-		self.animate.update()
-		# Let all windows be updated and handle events
-		self.root.update_idletasks()
-		# Update our window too
-		self.root.update()
-		# 1000 / 25 = 40 fps approximately of course
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.animate.step, self.animate.render)
 
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close (i.e. destroy) window"""
@@ -301,7 +258,7 @@ class TkScreenSaver:
 		# Cancelling all Tk timers to prevent warning messages from Tk
 		# when we destroy window while some timer on it has not been processed yet
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		# We destroy Toplevel window of tkscrsavers.py.
 		# It catches it up to run next screensaver in duty
 		self.root.destroy()
@@ -324,21 +281,14 @@ class App:
 		self.canvas = Canvas(self.win, width=WIDTH, height=HEIGHT)
 		self.canvas.pack()
 		self.animate = Main(self.canvas, options)
-		self.run()
+		self.scheduler = Scheduler(self.win)
+		self.scheduler.start(self.animate.step, self.animate.render)
 		self.win.mainloop()
 
-	def run(self, evt=None):
-		"""Run animation while not window closed or ESC key pressed"""
-		self.animate.update()
-		self.win.update_idletasks()
-		self.win.update()
-		# ~40 fps?
-		self.afterId = self.win.after(25, self.run)
-
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false, stop timer and close window"""
 		self.animate.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Run only if not in module mode
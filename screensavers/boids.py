@@ -28,6 +28,16 @@ Final adaption by Beotiger (c) 2024_03_30 22:25
 import math
 import random
 from tkinter import *
+try:
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _scheduler import Scheduler
+try:
+	import numpy as np
+except ImportError:
+	# NumPy is optional: without it only scalar engine is available
+	np = None
 
 WIDTH = 800
 HEIGHT = 650
@@ -67,7 +77,11 @@ app_options = {
 		'separationDist': 40,
 		# If we should use/watch new chase mechanic for our boids
 		'useChasePoints': True,
-		'showChasePoints': True
+		'showChasePoints': True,
+		# Simulation engine: 'scalar' (Boid objects) or 'array' (NumPy arrays, if available).
+		# Note: 'array' moves all boids at once from previous frame state while 'scalar'
+		# moves them one by one, so flocks behave alike but boids paths differ
+		'engine': 'scalar'
 }
 
 class Vector:
@@ -116,12 +130,42 @@ class Boid:
 		# @2024_03_28_1232 added chase vector and frames - frame counter
 		self.chase = None
 		self.frames = 0
+		# Persistent canvas items of the boid: body, eye, range and chase point
+		self.items = {}
+		# Keys of items hidden at the moment
+		self.hidden = set()
+		self.itemsVid = self.vid
+
+	def place(self, key, coords, create):
+		"""Move persistent canvas item @key of the boid to @coords.
+			Item is created by @create(coords) function when boid has no such item yet"""
+		if key not in self.items:
+			self.items[key] = create(coords)
+		else:
+			self.parent.canvas.coords(self.items[key], *coords)
+			if key in self.hidden:
+				self.parent.canvas.itemconfigure(self.items[key], state=NORMAL)
+				self.hidden.remove(key)
+
+	def hide(self, key):
+		"""Hide persistent canvas item @key of the boid if it has one"""
+		if key in self.items and key not in self.hidden:
+			self.parent.canvas.itemconfigure(self.items[key], state=HIDDEN)
+			self.hidden.add(key)
+
+	def undraw(self):
+		"""Delete all canvas items of the boid"""
+		for item in self.items.values():
+			self.parent.canvas.delete(item)
+		self.items = {}
+		self.hidden = set()
 
 	def drawAsABall(self):
 		"""Draw boid in ball shape"""
-		self.parent.create_circle(
-			self.position.x, self.position.y,
-			self.parent.options['boidRadius'] * self.size, fill=self.colour)
+		x, y = self.position.x, self.position.y
+		r = self.parent.options['boidRadius'] * self.size
+		self.place('body', (x - r, y - r, x + r, y + r),
+			lambda coords: self.parent.canvas.create_oval(coords, fill=self.colour))
 
 	def drawAsABoid(self):
 		"""Draw boid in boid shape)"""
@@ -137,34 +181,48 @@ class Boid:
 			xLeft, yLeft = x - ((lx + ly) >> 1), y - ((ly - lx) >> 1)
 			xRight, yRight = x - ((lx - ly) >> 1), y - ((ly + lx) >> 1)
 			poly = (xLeft, yLeft, xTail, yTail, xRight, yRight, xHead, yHead, xLeft, yLeft)
-			self.parent.canvas.create_polygon(poly, outline=self.colour, fill='')
-			# self.parent.drawLine(self.colour, xLeft, yLeft, xTail, yTail)
-			# self.parent.drawLine(self.colour, xRight, yRight, xTail, yTail)
-			# self.parent.drawLine(self.colour, xLeft, yLeft, xHead, yHead)
-			# self.parent.drawLine(self.colour, xRight, yRight, xHead, yHead)
+			self.place('body', poly,
+				lambda coords: self.parent.canvas.create_polygon(coords, outline=self.colour, fill=''))
 			# Draw an eye of the boid
-			self.parent.setPixel(self.colour, xEye, yEye)
+			self.place('eye', (xEye, yEye, xEye + 1, yEye + 1),
+				lambda coords: self.parent.setPixel(self.colour, *coords[:2]))
+		else:
+			self.hide('body')
+			self.hide('eye')
 
 	def drawVisibleRange(self):
 		"""@2024_02_15_1902 draw circle of visible range around selected boid
 				only for boid that was forced selected"""
 		if self.selected == 1:
-			self.parent.create_circle(
-				self.position.x, self.position.y,
-				self.parent.options['boidRadius'] * self.size + self.parent.options['visibleRadius'],
-				outline=self.colour, width=2)
+			x, y = self.position.x, self.position.y
+			r = self.parent.options['boidRadius'] * self.size + self.parent.options['visibleRadius']
+			self.place('range', (x - r, y - r, x + r, y + r),
+				lambda coords: self.parent.canvas.create_oval(coords, outline=self.colour, width=2))
+		else:
+			self.hide('range')
 		if self.chase is not None and self.parent.options['showChasePoints']:
-			self.parent.create_circle(
-				self.chase.x, self.chase.y, (self.frames % 5) + 1, fill=self.colour)
+			x, y, r = self.chase.x, self.chase.y, (self.frames % 5) + 1
+			self.place('chase', (x - r, y - r, x + r, y + r),
+				lambda coords: self.parent.canvas.create_oval(coords, fill=self.colour))
+		else:
+			self.hide('chase')
 
 	def draw(self):
-		"""Can draw boid in two shapes: like a triangle with the head ahead or like a ball"""
+		"""Can draw boid in two shapes: like a triangle with the head ahead or like a ball.
+			@2026_10_18 Boid keeps its canvas items and only moves them every frame"""
+		# Recreate items if boid representation was changed
+		if self.items and self.itemsVid != self.vid:
+			self.undraw()
+		self.itemsVid = self.vid
 		if self.vid == 'ball':
 			self.drawAsABall()
 		else:
 			self.drawAsABoid()
 		if self.selected:
 			self.drawVisibleRange()
+		else:
+			self.hide('range')
+			self.hide('chase')
 
 	def update(self):
 		"""Update the boid positions according to Reynold's rules.
@@ -180,9 +238,7 @@ class Boid:
 					self.selected = 0
 			else: self.applyForce(self.seek(self.chase))
 		else:
-			v1 = self.cohesion()
-			v2 = self.separation()
-			v3 = self.alignment()
+			v1, v2, v3 = self.flock()
 			v4 = self.interactivity()
 			# Weight rules to get best behaviour
 			v1.mult(1.2)
@@ -237,70 +293,53 @@ class Boid:
 		return steer.limit(self.parent.maxForce)
 
 	# BOIDS FLOCKING RULES
-	def cohesion(self):
-		"""Cohesion rule: steer towards average position of local flockmates"""
-		sum = Vector(0, 0)	# average flockmate position
-		count = 0 					# number of local flockmates
-		# For each boid close enough to be seen...
-		for i in range(len(self.parent.boids)):
-			d = self.position.dist(self.parent.boids[i].position)
-			if d > 0 and d < self.parent.options['visibleRadius']:
-				sum = sum.add(self.parent.boids[i].position)
+	def flock(self):
+		"""Cohesion, separation and alignment rules computed in one pass over neighbours.
+			Every pair distance is calculated once and shared by all three rules.
+			Returns three steering vectors: cohesion, separation and alignment"""
+		options = self.parent.options
+		visible = options['visibleRadius']
+		body = self.size * options['boidRadius']
+		colorize = options['boidRadius'] * 10 * int(options['colorize'])
+		x, y = self.position.x, self.position.y
+		# Cohesion: sum of flockmates positions, alignment: sum of their velocities
+		cx, cy, ax, ay, count = 0, 0, 0, 0, 0
+		# Separation: sum of vectors pointing away from too close flockmates
+		sx, sy, scount = 0, 0, 0
+		for boid in self.parent.neighbours(self.position, max(visible, self.parent.separationRange(self))):
+			dx, dy = x - boid.position.x, y - boid.position.y
+			dist = math.sqrt(dx * dx + dy * dy)
+			# For each boid close enough to be seen...
+			if dist > 0 and dist < visible:
+				cx += boid.position.x
+				cy += boid.position.y
+				ax += boid.velocity.x
+				ay += boid.velocity.y
 				count += 1
-		if (count > 0):
-			# Calculate average position and return the force required to steer towards it
-			sum = sum.div(Vector(count, count))
-			sum = self.seek(sum)
-			return sum
-		return Vector(0, 0)
-
-	def separation(self):
-		"""Separation rule: steer to avoid crowding local flockmates"""
-		steer = Vector()	# average steer
-		count = 0							# number of flockmates considered "too close"
-		# For each boid which is too close, calculate a vector pointing
-		# away from it weighted by the distance to it
-		for i in range(len(self.parent.boids)):
-			d = self.position.dist(self.parent.boids[i].position) - self.size * self.parent.options['boidRadius']
+			# For each boid which is too close, calculate a vector pointing
+			# away from it weighted by the distance to it
+			d = dist - body
 			# @2024_04_07_2114 colorize separation added
-			if self.colour != self.parent.boids[i].colour:
-				colorize = self.parent.options['boidRadius'] * 10 * int(self.parent.options['colorize'])
-			else:
-				colorize = 0
-			if d > 0 and d < self.parent.options['separationDist'] + colorize:
-				diff = self.position.sub(self.parent.boids[i].position)
-				diff = diff.norm()
-				diff = diff.div(Vector(d, d))
-				steer = steer.add(diff)
-				count += 1
-		# Calculate average
-		if count > 0:
-			steer = steer.div(Vector(count, count))
-		# Steering = Desired - Velocity
-		if steer.mag() > 0:
-			steer = steer.norm()
-			steer = steer.mul(Vector(self.speed, self.speed))
-			steer = steer.sub(self.velocity)
-			steer = steer.limit(self.parent.maxForce)
-		return steer
-
-	def alignment(self):
-		"""Alignment rule: steer toward average heading of local flockmates"""
-		sum = Vector(0, 0)	# Average velocity
-		count = 0						# number of local flockmates
-		# For each boid which is close enough to be seen
-		for i in range(len(self.parent.boids)):
-			d = self.position.dist(self.parent.boids[i].position)
-			if d > 0 and d < self.parent.options['visibleRadius']:
-				sum = sum.add(self.parent.boids[i].velocity)
-				count +=1
+			if d > 0 and d < options['separationDist'] + (colorize if self.colour != boid.colour else 0):
+				sx += dx / dist / d
+				sy += dy / dist / d
+				scount += 1
+		cohesion, separation, alignment = Vector(0, 0), Vector(sx, sy), Vector(0, 0)
 		if count > 0:
-			# Calculate average and limit
-			sum = sum.div(Vector(count, count)).norm().mul(Vector(self.speed, self.speed))
+			# Calculate average position and the force required to steer towards it
+			cohesion = self.seek(Vector(cx, cy).div(Vector(count, count)))
+			# Calculate average heading and limit
+			heading = Vector(ax, ay).div(Vector(count, count)).norm().mul(Vector(self.speed, self.speed))
 			# Steering = Desired - Velocity
-			steer = sum.sub(self.velocity).limit(self.parent.maxForce)
-			return steer
-		return Vector(0, 0)
+			alignment = heading.sub(self.velocity).limit(self.parent.maxForce)
+		# Calculate average
+		if scount > 0:
+			separation = separation.div(Vector(scount, scount))
+		# Steering = Desired - Velocity
+		if separation.mag() > 0:
+			separation = separation.norm().mul(Vector(self.speed, self.speed))
+			separation = separation.sub(self.velocity).limit(self.parent.maxForce)
+		return cohesion, separation, alignment
 
 	def interactivity(self):
 		"""If boids should follow mouse cursor"""
@@ -311,6 +350,177 @@ class Boid:
 		): return self.seek(self.parent.mousePos)
 		return Vector(0, 0)
 
+class BoidsEngine:
+	"""Vectorised simulation of all boids using NumPy arrays.
+		Positions, velocities and other boid parameters are stored in contiguous float arrays
+		and Reynold's rules are computed with pairwise distance matrices.
+		For large number of boids these matrices are computed in tiles of TILE rows.
+		Boid objects are still used for drawing: only final coordinates are handed to them.
+		Note: unlike scalar engine all boids are updated at once from previous frame state.
+		Scalar engine updates boids one by one in place, so every boid there sees already moved
+		positions and velocities of boids before it. Repeating that order would need a Python loop
+		over boids, so engines apply the same rules (see tests/test_boids_engine.py) but their
+		trajectories drift apart: by about a pixel in 5 frames and completely in a few hundred"""
+	TILE = 256
+
+	def __init__(self, parent):
+		"""parent refers to BoidsCanvas"""
+		self.parent = parent
+		# Random generator seeded from random module so that random.seed() rules both engines
+		self.rng = np.random.default_rng(random.getrandbits(32))
+		self.load()
+
+	def load(self):
+		"""Gather state of parent boids into arrays. Called when boids are added or recreated"""
+		boids = self.parent.boids
+		self.pos = np.array([(b.position.x, b.position.y) for b in boids], dtype=float).reshape(-1, 2)
+		self.vel = np.array([(b.velocity.x, b.velocity.y) for b in boids], dtype=float).reshape(-1, 2)
+		self.size = np.array([b.size for b in boids], dtype=float)
+		self.speed = np.array([b.speed for b in boids], dtype=float)
+		self.frames = np.array([b.frames for b in boids], dtype=int)
+		self.chasing = np.array([b.chase is not None for b in boids], dtype=bool)
+		self.chase = np.array([(b.chase.x, b.chase.y) if b.chase is not None else (0, 0) for b in boids], dtype=float).reshape(-1, 2)
+		colours = {}
+		self.colour = np.array([colours.setdefault(b.colour, len(colours)) for b in boids], dtype=int)
+
+	def limit(self, v, limit):
+		"""Limit magnitudes of vectors in (n, 2) array @v by @limit (scalar or (n,) array)"""
+		mag = np.hypot(v[:, 0], v[:, 1])
+		scale = np.where(mag > limit, limit / np.where(mag > 0, mag, 1), 1)
+		return v * scale[:, None]
+
+	def norm(self, v):
+		"""Normalize vectors in (n, 2) array @v, zero vectors stay zero"""
+		mag = np.hypot(v[:, 0], v[:, 1])
+		return v / np.where(mag > 0, mag, 1)[:, None]
+
+	def seek(self, target, rows):
+		"""Steering forces towards @target positions for boids with indices @rows"""
+		desired = self.norm(target - self.pos[rows]) * self.speed[rows, None]
+		return self.limit(desired - self.vel[rows], self.parent.maxForce)
+
+	def flock(self, rows):
+		"""Cohesion, separation and alignment forces for boids with indices @rows
+			against all boids, in one pass over the pairwise distance matrix"""
+		options = self.parent.options
+		visible = options['visibleRadius']
+		colorize = options['boidRadius'] * 10 * int(options['colorize'])
+		x, y = self.pos[:, 0], self.pos[:, 1]
+		dist = np.sqrt((x[rows, None] - x) ** 2 + (y[rows, None] - y) ** 2)
+		# Cohesion and alignment: flockmates close enough to be seen
+		seen = ((dist > 0) & (dist < visible)).astype(float)
+		count = seen.sum(axis=1)
+		has = count > 0
+		cohesion = np.zeros((len(rows), 2))
+		alignment = np.zeros((len(rows), 2))
+		if has.any():
+			idx = rows[has]
+			cnt = count[has, None]
+			cohesion[has] = self.seek((seen[has] @ self.pos) / cnt, idx)
+			heading = self.norm((seen[has] @ self.vel) / cnt) * self.speed[idx, None]
+			alignment[has] = self.limit(heading - self.vel[idx], self.parent.maxForce)
+		# Separation: flockmates which are too close weighted by the distance to them.
+		# Sum of (pos[i] - pos[j]) / dist / d is pos[i] * sum(w) - w @ pos with w = 1 / (dist * d)
+		d = dist - (self.size[rows] * options['boidRadius'])[:, None]
+		near = options['separationDist'] + colorize * (self.colour[rows, None] != self.colour)
+		close = (d > 0) & (d < near)
+		with np.errstate(divide='ignore', invalid='ignore'):
+			weight = np.where(close, 1 / (dist * d), 0)
+		steer = self.pos[rows] * weight.sum(axis=1)[:, None] - weight @ self.pos
+		steer /= np.maximum(close.sum(axis=1), 1)[:, None]
+		mag = np.hypot(steer[:, 0], steer[:, 1])
+		moving = mag > 0
+		separation = steer
+		if moving.any():
+			idx = rows[moving]
+			desired = self.norm(steer[moving]) * self.speed[idx, None]
+			separation[moving] = self.limit(desired - self.vel[idx], self.parent.maxForce)
+		return cohesion, separation, alignment
+
+	def step(self):
+		"""Update all boids positions according to Reynold's rules. Called on every frame"""
+		parent, options = self.parent, self.parent.options
+		n = len(self.pos)
+		if n == 0: return
+		self.frames += 1
+		acc = np.zeros((n, 2))
+		# Boids which catch up their chase points stop chasing
+		dx = self.pos - self.chase
+		caught = self.chasing & (np.hypot(dx[:, 0], dx[:, 1]) < self.size * 2)
+		self.chasing &= ~caught
+		self.speed[caught] = options['speed']
+		chasers = np.flatnonzero(self.chasing)
+		if len(chasers):
+			acc[chasers] = self.seek(self.chase[chasers], chasers)
+		flockers = np.flatnonzero(~self.chasing & ~caught)
+		for start in range(0, len(flockers), self.TILE):
+			rows = flockers[start:start + self.TILE]
+			v1, v2, v3 = self.flock(rows)
+			# Weight rules to get best behaviour
+			force = v1 * 1.2 + v2 * 1.8 + v3
+			if options['interactive'] and parent.mousePos:
+				mouse = np.array([parent.mousePos.x, parent.mousePos.y])
+				dm = self.pos[rows] - mouse
+				follow = np.hypot(dm[:, 0], dm[:, 1]) < options['visibleRadius']
+				if follow.any():
+					force[follow] += self.seek(mouse, rows[follow]) * 1.8
+			acc[rows] = force
+		# A = F / M with M = boid size so that larger boids have more inertia
+		acc /= self.size[:, None]
+		self.vel = self.limit(self.vel + acc, self.speed)
+		self.pos += self.vel
+		self.borders()
+		# Chance to chase random point
+		if options['useChasePoints']:
+			lucky = ~self.chasing & (self.frames % 100 == 0) & (self.rng.random(n) < 0.05)
+			self.newChase(lucky)
+
+	def newChase(self, mask):
+		"""Spawn random chase points for boids selected by @mask and speed them up"""
+		k = int(mask.sum())
+		if k:
+			self.chase[mask] = np.column_stack((
+				self.rng.integers(0, self.parent.w, k, endpoint=True),
+				self.rng.integers(0, self.parent.h, k, endpoint=True)))
+			self.chasing |= mask
+			self.speed[mask] *= 2.5
+
+	def borders(self):
+		"""Rules for window edges behaviour"""
+		w, h = self.parent.w, self.parent.h
+		x, y = self.pos[:, 0], self.pos[:, 1]
+		if self.parent.options['bounce']:
+			# Implement bouncing behaviour
+			out = (x < 0) | (x > w)
+			self.vel[out, 0] *= -1
+			self.newChase(out)
+			out = (y < 0) | (y > h)
+			self.vel[out, 1] *= -1
+			self.newChase(out)
+		else:
+			# Implement torus boundaries
+			x[x < 0] = w
+			y[y < 0] = h
+			x[x > w] = 0
+			y[y > h] = 0
+
+	def store(self):
+		"""Hand final state of arrays to Boid objects for drawing"""
+		pos, vel, chase = self.pos.tolist(), self.vel.tolist(), self.chase.tolist()
+		speed, frames, chasing = self.speed.tolist(), self.frames.tolist(), self.chasing.tolist()
+		for i, boid in enumerate(self.parent.boids):
+			boid.position.x, boid.position.y = pos[i]
+			boid.velocity.x, boid.velocity.y = vel[i]
+			boid.speed, boid.frames = speed[i], frames[i]
+			if chasing[i]:
+				if boid.chase is None:
+					boid.chase = Vector()
+					if boid.selected != 1: boid.selected = 2
+				boid.chase.x, boid.chase.y = chase[i]
+			elif boid.chase is not None:
+				boid.chase = None
+				if boid.selected == 2: boid.selected = 0
+
 class BoidsCanvas:
 	"""Main boids canvas class - director of all boids"""
 	def __init__(self, canvas, options):
@@ -328,6 +538,11 @@ class BoidsCanvas:
 		# For interactive mode
 		self.mousePos = None
 		self.boids = []
+		# @2026_10_18 uniform grid of boids rebuilt every frame: (col, row) -> list of boids
+		self.grid = {}
+		self.cellSize = 1
+		# Vectorised engine, used only with option engine: 'array'
+		self.engine = None
 		# Maximum force! :)
 		self.maxForce = 0.04
 		self.init()
@@ -336,6 +551,7 @@ class BoidsCanvas:
 		"""Add new boid on mouse left click"""
 		if self.mousePos is not None and len(self.boids) < self.maxboids:
 			self.newBoid(self.mousePos)
+			if self.engine is not None: self.engine.load()
 			self.showVars()
 	def selectBoid(self, evt):
 		"""Select boid to see its visible radius"""
@@ -398,6 +614,8 @@ class BoidsCanvas:
 
 	def initialiseBoids(self):
 		"""Initialise boids according to options"""
+		for boid in self.boids:
+			boid.undraw()
 		self.boids = []
 		# Get may be changed width/height of the canvas
 		self.w, self.h = self.canvas.winfo_width(), self.canvas.winfo_height()
@@ -419,6 +637,8 @@ class BoidsCanvas:
 		for _ in range(num):
 			position = Vector(random.randint(0, self.w), random.randint(0, self.h))
 			self.newBoid(position)
+		# Fall back to scalar engine when NumPy is not installed
+		self.engine = BoidsEngine(self) if self.options['engine'] == 'array' and np is not None else None
 		# self.update()
 
 	def newBoid(self, position):
@@ -432,6 +652,32 @@ class BoidsCanvas:
 		colour = random.choice(self.options['boidColours'])
 		self.boids.append(Boid(self, position, velocity, size, self.options['vid'], colour))
 
+	def buildGrid(self):
+		"""Rebuild uniform grid of boids with cells sized to visibleRadius.
+			Called once per frame before boids update"""
+		self.cellSize = max(self.options['visibleRadius'], 1)
+		self.grid = {}
+		for boid in self.boids:
+			cell = (int(boid.position.x // self.cellSize), int(boid.position.y // self.cellSize))
+			if cell in self.grid: self.grid[cell].append(boid)
+			else: self.grid[cell] = [boid]
+
+	def neighbours(self, position, radius):
+		"""Yield boids from grid cells which can be within @radius from @position.
+			Caller should still check real distance to every returned boid"""
+		cs = self.cellSize
+		span = max(math.ceil(radius / cs), 1)
+		cx, cy = int(position.x // cs), int(position.y // cs)
+		for i in range(cx - span, cx + span + 1):
+			for j in range(cy - span, cy + span + 1):
+				if (i, j) in self.grid:
+					yield from self.grid[i, j]
+
+	def separationRange(self, boid):
+		"""Maximum center to center distance at which @boid still separates from others"""
+		colorize = self.options['boidRadius'] * 10 if self.options['colorize'] else 0
+		return self.options['separationDist'] + colorize + boid.size * self.options['boidRadius']
+
 	def drawLine(self, colour, x1, y1, x2, y2):
 		"""Draw a line on the canvas with specified color"""
 		return self.canvas.create_line(x1, y1, x2, y2, width=1, capstyle=ROUND, fill=colour)
@@ -444,15 +690,21 @@ class BoidsCanvas:
 		"""Draw circle at x,y coords with radius r, kwargs - more optional Tk parameters"""
 		return self.canvas.create_oval(x - r, y - r, x + r, y + r, **kwargs)
 
-	def update(self):
-		"""Main update routine"""
+	def step(self, dt):
+		"""Move boids by one frame of @dt seconds"""
+		if self.running:
+			if self.engine is not None:
+				self.engine.step()
+				self.engine.store()
+			else:
+				# Put boids into grid cells so flocking rules look only at nearby ones
+				self.buildGrid()
+				for i in range(len(self.boids)):
+					self.boids[i].update()
+
+	def render(self):
+		"""Draw boids where they are now"""
 		if self.running:
-			# Clear canvas
-			self.canvas.delete('all')
-			# Update boids
-			for i in range(len(self.boids)):
-				self.boids[i].update()
-			# Draw boids
 			for i in range(len(self.boids)):
 				self.boids[i].draw()
 			# Print some statistics on the glass pane
@@ -483,18 +735,13 @@ class TkScreenSaver:
 													bd=0, relief='ridge', highlightthickness=0, cursor='none')
 		self.canvas.pack()
 		self.boids = BoidsCanvas(self.canvas, options)
-		self.run()
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move"""
-		self.boids.update()
-		self.root.update_idletasks()
-		self.root.update()
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.boids.step, self.boids.render)
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.boids.running = False
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.root.destroy()
 
 class App:
@@ -513,19 +760,13 @@ class App:
 		# Close main window and exit on ESC keypress
 		self.win.bind('<KeyPress-Escape>', self.fin)
 		self.win.protocol('WM_DELETE_WINDOW', self.fin)
-		self.run()
+		self.scheduler = Scheduler(self.win)
+		self.scheduler.start(self.boids.step, self.boids.render)
 		self.win.mainloop()
-	def run(self, evt=None):
-		"""Running animations while window closed or ESC key pressed"""
-		self.boids.update()
-		self.win.update_idletasks()
-		self.win.update()
-		# 40 fps? )
-		self.afterId = self.win.after(25, self.run)
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.boids.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Run only if not in module mode
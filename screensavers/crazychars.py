@@ -14,6 +14,15 @@ While tersting this module you can do the following:
 import random
 import math
 from tkinter import *
+try:
+	from ._glyphs import GlyphAtlas
+	from ._colors import gradient
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _glyphs import GlyphAtlas
+	from _colors import gradient
+	from _scheduler import Scheduler
 
 WIDTH, HEIGHT = 800, 600
 
@@ -33,7 +42,9 @@ app_options = {
 	'color1': '#168324',
 	'color2': '#1c2577',
 	# Speed 1 to 5: 1 - min, 5 - max
-	'speed': 3
+	'speed': 3,
+	# Font file name or full path, '' - look for a font with katakana glyphs
+	'fontfile': ''
 }
 
 class Vector:
@@ -82,73 +93,25 @@ class Vector:
 	def __str__(self) -> str:
 		return f'V({round(self.x, 2)}, {round(self.y, 2)})'
 
-class GradientColor:
-	@staticmethod
-	def hex_to_RGB(hex):
-		""" '#FFFFFF' -> [255,255,255] """
-		# Pass 16 to the integer function for change of base
-		return [int(hex[i:i+2], 16) for i in range(1, 6, 2)]
-
-	@staticmethod
-	def RGB_to_hex(RGB):
-		""" [255,255,255] -> '#FFFFFF' """
-		# Components need to be integers for hex to make sense
-		RGB = [int(x) for x in RGB]
-		return "#"+"".join(["0{0:x}".format(v) if v < 16 else
-							"{0:x}".format(v) for v in RGB])
-
-	@staticmethod
-	def color_dict(gradient):
-		"""Takes in a list of RGB sub-lists and returns dictionary of
-			colors in RGB and hex form for use in a graphing function
-			defined later on"""
-		return {"hex":[GradientColor.RGB_to_hex(RGB) for RGB in gradient],
-				"r":[RGB[0] for RGB in gradient],
-				"g":[RGB[1] for RGB in gradient],
-				"b":[RGB[2] for RGB in gradient]}
-
-	@staticmethod
-	def linear_gradient(start_hex, finish_hex="#FFFFFF", n=10):
-		"""Returns a gradient list of (n) colors between
-			two hex colors. start_hex and finish_hex
-			should be the full six-digit color string,
-			inlcuding the number sign ("#FFFFFF")"""
-		# Starting and ending colors in RGB form
-		s = GradientColor.hex_to_RGB(start_hex)
-		f = GradientColor.hex_to_RGB(finish_hex)
-		# Initilize a list of the output colors with the starting color
-		RGB_list = [s]
-		# Calcuate a color at each evenly spaced value of t from 1 to n
-		for t in range(1, n):
-			# Interpolate RGB vector for color at the current value of t
-			curr_vector = [
-				int(s[j] + (float(t)/(n-1))*(f[j]-s[j]))
-				for j in range(3)
-			]
-			# Add it to our list of output colors
-			RGB_list.append(curr_vector)
-		return GradientColor.color_dict(RGB_list)
-
 class Char:
-	def __init__(self, main, char, x, y, size, color, speed, masterId=0, cycles=-1):
-		"""If @masterId == 0 this is master char"""
+	def __init__(self, main, char, x, y, size, color, speed, master=None, cycles=-1):
+		"""If @master is None this is master char"""
 		self.main = main
 		self.char = char
 		self.pos = Vector(x, y)
 		self.size =	size
 		self.color = color
 		self.speed = speed
-		self.id = main.create_text(self.pos.x, self.pos.y, self.char, self.color, ('MS Mincho.ttf', size , 'bold'))
-		# If it is not master char tag it for deletion
-		if masterId:
-			main.canvas.addtag_withtag(f't_{masterId}', self.id)
-			# print('Tag added:', f't_{masterId}')
+		# Canvas item is created by Main.render
+		self.id = None
+		# Item should be moved to pos or show new char on next render
+		self.moved = self.changed = False
 		# Char behaviour
 		self.behave = self.matrix
 		# Cycles to live (-1 - forever)
 		self.cycles = cycles
-		# Id of master char
-		self.masterId = masterId
+		# Master char
+		self.master = master
 		# Reproductive mechanics
 		self.reprod = True
 
@@ -157,41 +120,39 @@ class Char:
 			self.cycles -= 1
 		self.clone()
 		self.behave()
-		self.main.canvas.coords(self.id, self.pos.x, self.pos.y)
+		self.moved = True
 
 	def clone(self):
 		"""Clone char if it size allows it. We can clone ony char during lifecycle?"""
 		if self.reprod and self.size > 4:
 			color = random.choice(self.main.colors)
-			id = self.masterId if self.masterId else self.id
+			master = self.master or self
 			size = self.size - 2
-			self.main.chars.append(
-				Char(self.main, random.choice(self.main.letters), self.pos.x + 2, self.pos.y + 2, size, color, self.speed, id)
+			self.main.childs.setdefault(master, []).append(
+				Char(self.main, random.choice(self.main.letters), self.pos.x + 2, self.pos.y + 2, size, color, self.speed, master)
 			)
 			self.reprod = False
 
 	def dead(self):
 		"""Determine if we are dead:
 		we are not top level symbol and our Y coordinate overlaps window height"""
-		isdead = self.masterId and self.pos.y > self.main.h - self.size
-		if isdead: self.main.canvas.delete(self.id)
+		isdead = self.master is not None and self.pos.y > self.main.h - self.size
+		if isdead: self.main.remove(self)
 		return isdead
 
 	def matrix(self):
 		"""Matrix behaviour"""
 		self.pos.y += self.size * self.speed
-		if (not self.masterId) and self.pos.y > self.main.h:
+		if self.master is None and self.pos.y > self.main.h:
 			self.reprod = True
 			self.pos.y = 0
 			self.speed = self.main.chooseSpeed()
-			# Delete all child chars from the list
-			n = self.main.delChilds(self.id)
+			# Delete all child chars from the list and from the canvas
+			n = self.main.delChilds(self)
 			# print(f'Matrix:{n} childs removed')
-			# And from the canvas
-			self.main.canvas.delete(f't_{self.id}')
 			# Change symbol char
 			self.char = random.choice(self.main.letters)
-			self.main.canvas.itemconfigure(self.id, text=self.char)
+			self.changed = True
 
 class Main:
 	"""Main canvas class where all animation occurs"""
@@ -217,11 +178,14 @@ class Main:
 		self.canvas.bind('<Configure>', self.resize)
 		self.canvas.bind('<Destroy>', self.game_over)
 		# Main attributes
-		self.colors = GradientColor.linear_gradient(options['color1'], options['color2'], 32)['hex']
+		self.colors = gradient(options['color1'], options['color2'], 32).hex
 		self.font_size = self.options['fontsize']
 		# self.font = ('MS Mincho.ttf', self.font_size, 'bold')
 		# self.font = ('Consolas', self.font_size)
 		self.letters = [chr(int('0x30a0', 16) + i) for i in range(1, 95)]
+		# Pre-rendered chars images if Pillow and font are available.
+		# There are too many chars, colors and sizes combinations so keep only recently used ones
+		self.glyphs = GlyphAtlas(self.canvas, self.options['fontfile'] or None, bold=True, limit=4096)
 		# Run init animation at first time
 		self.options['speed'] = self.constrain(self.options['speed'], 1, 5)
 		# print(f"self.options['speed']={self.options['speed']}")
@@ -240,6 +204,16 @@ class Main:
 
 	def create_text(self, x, y, text, fill, font, **kwargs):
 		return self.canvas.create_text(x, y, text=text, fill=fill, font=font, anchor=NW, **kwargs)
+	def create_char(self, x, y, char, color, size):
+		"""Create char item as glyph image or as text item"""
+		if self.useGlyphs:
+			return self.canvas.create_image(x, y, image=self.glyphs.get(char, color, size), anchor=NW)
+		return self.create_text(x, y, char, color, ('MS Mincho.ttf', size , 'bold'))
+	def charOptions(self, char):
+		"""Return itemconfigure options for Tcl script to show new char of @char"""
+		if self.useGlyphs:
+			return f'-image {self.glyphs.get(char.char, char.color, char.size)}'
+		return f'-text {char.char}'
 
 	# Some events bindings
 	def toggle_fullscreen(self, evt=None):
@@ -279,35 +253,71 @@ class Main:
 		gap = 10
 		self.columns = self.w // (self.font_size + gap)
 		self.canvas.delete(ALL)
+		# Canvas items of removed chars to delete on next render
+		self.deleted = []
+		# All chars are drawn the same way: as glyph images or as text items
+		self.useGlyphs = self.glyphs.available(self.font_size)
 		# Set gap between chars in a row
 		# Create self.columns chars at the top of the screen in a row
-		self.chars = [Char(self, random.choice(self.letters), i * (self.font_size + gap), 0, self.font_size, random.choice(self.colors), self.chooseSpeed()) for i in range(self.columns)]
-		# self.chars = [Char(self, random.choice(self.letters), self.w // 2 - self.font_size, 0, self.font_size, random.choice(self.colors), random.uniform(1, 1.5))]
+		self.masters = [Char(self, random.choice(self.letters), i * (self.font_size + gap), 0, self.font_size, random.choice(self.colors), self.chooseSpeed()) for i in range(self.columns)]
+		# self.masters = [Char(self, random.choice(self.letters), self.w // 2 - self.font_size, 0, self.font_size, random.choice(self.colors), random.uniform(1, 1.5))]
+		# Child chars lists by their masters
+		self.childs = {}
 		# self.update()
 		self.speed = 6 - self.options['speed']
 
-	def update(self):
-		"""Main update routine"""
+	def step(self, dt):
+		"""Tick chars every few steps depending on speed option"""
 		if self.running:
-			# Clear canvas if needed
-			# self.canvas.delete('all')
 			self.speed -= 1
 			if self.speed == 0:
 				self.speed = 6 - self.options['speed']
-				for char in self.chars[:]:
+				# Masters go first: they can remove their childs when restarting
+				for char in self.masters:
 					char.tick()
-					if char.dead() and char in self.chars: self.chars.remove(char)
+				for master, childs in self.childs.items():
+					# Chars cloned during this tick are not ticked until the next one
+					n = len(childs)
+					for char in childs[:n]:
+						char.tick()
+					self.childs[master] = [char for char in childs[:n] if not char.dead()] + childs[n:]
 
-			# print(len(self.chars))
+			# print(len(self.masters) + sum(map(len, self.childs.values())))
 			# self.running = False
 
-	def delChilds(self, masterId):
-		n = 0
-		for char in self.chars[:]:
-			if char.masterId == masterId:
-				self.chars.remove(char)
-				n += 1
-		return n
+	def render(self):
+		"""Create items of new chars and send all deletions, moves and char changes to Tcl as one script"""
+		if self.running:
+			# All glyphs got so far are shown by items, so atlas can drop unused ones
+			self.glyphs.trim()
+			path = str(self.canvas)
+			script = []
+			if self.deleted:
+				script.append(f'{path} delete {" ".join(map(str, self.deleted))}\n')
+				self.deleted.clear()
+			for chars in [self.masters, *self.childs.values()]:
+				for char in chars:
+					if char.id is None:
+						char.id = self.create_char(char.pos.x, char.pos.y, char.char, char.color, char.size)
+					else:
+						if char.changed:
+							script.append(f'{path} itemconfigure {char.id} {self.charOptions(char)}\n')
+						if char.moved:
+							script.append(f'{path} coords {char.id} {char.pos.x} {char.pos.y}\n')
+					char.moved = char.changed = False
+			if script:
+				self.canvas.tk.eval(''.join(script))
+
+	def remove(self, char):
+		"""Delete canvas item of removed @char on next render"""
+		if char.id is not None: self.deleted.append(char.id)
+
+	def delChilds(self, master):
+		"""Remove all child chars of @master from the lists and return their number"""
+		childs = self.childs.pop(master, ())
+		for char in childs:
+			self.remove(char)
+		return len(childs)
 
 class TkScreenSaver:
 	"""Screensaver differs from App that it need not create main toplevel window
@@ -326,17 +336,8 @@ class TkScreenSaver:
 		self.canvas.pack()
 		# Should give Main link to canvas for drawing and options to use
 		self.animate = Main(self.canvas, options)
-		self.run()
-
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move as a rule"""
-		self.animate.update()
-		# Let all windows be updated and handle events
-		self.root.update_idletasks()
-		# Update our window too
-		self.root.update()
-		# 1000 / 25 = 40 fps approximately of course
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.animate.step, self.animate.render)
 
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close (i.e. destroy) window"""
@@ -344,7 +345,7 @@ class TkScreenSaver:
 		# Cancelling all Tk timers to prevent warning messages from Tk
 		# when we destroy window while some timer on it has not been processed yet
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		# We destroy Toplevel window of tkscrsavers.py.
 		# It catches it up to run next screensaver in duty
 		self.root.destroy()
@@ -364,21 +365,14 @@ class App:
 		self.canvas = Canvas(self.win, width=WIDTH, height=HEIGHT)
 		self.canvas.pack()
 		self.animate = Main(self.canvas, options)
-		self.run()
+		self.scheduler = Scheduler(self.win)
+		self.scheduler.start(self.animate.step, self.animate.render)
 		self.win.mainloop()
 
-	def run(self, evt=None):
-		"""Run animation while not window closed or ESC key pressed"""
-		self.animate.update()
-		self.win.update_idletasks()
-		self.win.update()
-		# ~40 fps?
-		self.afterId = self.win.after(25, self.run)
-
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false, stop timer and close window"""
 		self.animate.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Run only if not in module mode
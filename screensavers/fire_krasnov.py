@@ -10,12 +10,27 @@
 """
 
 # Import needed libraries here, tkinter is a must obviously
+import logging
 import random
+import math
+import time
 from tkinter import *
+try:
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _scheduler import Scheduler
+try:
+	import numpy as np
+except ImportError:
+	# NumPy is optional: without it fire is drawn with KrasFire rectangles
+	np = None
 
 # Default width and height of canvas when testing screensaver.
 WIDTH, HEIGHT = 320, 250
 
+logger = logging.getLogger(__name__)
+
 # Default screensaver settings.
 # They are used in tkscrsavers.py so we should not change their names
 # but should and must change their values
@@ -28,13 +43,25 @@ app_date = '2025-01-25'
 app_license = 'MIT'
 # Default screensaver options in a form of a dict
 app_options = {
-	'background': 'black'
+	'background': 'black',
+	# Fire grid size in cells, 0 - pick grid automatically from screen size
+	'gridWidth': 50,
+	'gridHeight': 50,
+	# Target time of one fire frame in ms for automatic grid size
+	'frameTime': 20
 }
 
 STEP = 0.04
 FADE = 0.385
 NUMX = 50
 NUMY = 50
+# Starting fire cell size in pixels for automatic grid
+AUTOCELL = 8
+# Number of cells in a row mixed at once by FireField
+MIXBLOCK = 16
+# Fire grids picked by autoFire for canvas size and options,
+# so that grid is calibrated only once for every screen size
+autoGrids = {}
 
 class TCol():
 	"""Represents RGB color from 0 to 1 as in OpenGL"""
@@ -43,15 +70,42 @@ class TCol():
 		self.g = 0.0
 		self.b = 0.0
 
+class FirePalette:
+	"""Precomputed conversion of fire colors to hex strings and RGB bytes.
+		For hex strings every color component 0..1 (OpenGL) is quantised into LEVELS levels
+		and colors are taken from the table of all LEVELS ** 3 strings by packed levels index.
+		RGB bytes are converted from components directly with full 0..255 precision"""
+	LEVELS = 32
+
+	def __init__(self):
+		top = self.LEVELS - 1
+		digits = [f'{level * 255 // top:02X}' for level in range(self.LEVELS)]
+		# Packed levels (r * LEVELS + g) * LEVELS + b -> '#RRGGBB'
+		self.colors = ['#' + r + g + b for r in digits for g in digits for b in digits]
+
+	def hex(self, col):
+		"""Return #RRGGBB string for TCol @col"""
+		top = self.LEVELS - 1
+		r, g, b = int(col.r * top), int(col.g * top), int(col.b * top)
+		r = 0 if r < 0 else top if r > top else r
+		g = 0 if g < 0 else top if g > top else g
+		b = 0 if b < 0 else top if b > top else b
+		return self.colors[(r * self.LEVELS + g) * self.LEVELS + b]
+
+	def bytes(self, field):
+		"""Return uint8 array of RGB bytes for NumPy array @field of color components"""
+		return np.clip(field * 255, 0, 255).astype(np.uint8)
+
 class KrasFire:
 	"""Main class to display fire mimic"""
 	def __init__(self, master):
-		self.PreF = [TCol() for i in range(NUMX)]
-		self.Fire = [[TCol() for i in range(NUMX)] for j in range(NUMY)]
+		self.numx, self.numy, self.fade = master.numx, master.numy, master.fade
+		self.PreF = [TCol() for i in range(self.numx)]
+		self.Fire = [[TCol() for j in range(self.numy)] for i in range(self.numx)]
 		self.master = master
 
 	def SetFire(self):
-		for i in range(1, NUMX - 1):
+		for i in range(1, self.numx - 1):
 			f = random.randint(0, 299) / 100 - 0.8
 			self.PreF[i].r = f
 			self.PreF[i].g = f / 1.4
@@ -59,51 +113,113 @@ class KrasFire:
 
 	def DrawPix(self, x, y):
 		""" Draw 1 fire pixel """
-		# Convert color from 0..1 (OpenGL) to 0..255
-		r, g, b = int(self.Fire[x][y].r * 255), int(self.Fire[x][y].g * 255), int(self.Fire[x][y].b * 255)
-		r = self.master.constrain(r, 0, 255)
-		g = self.master.constrain(g, 0, 255)
-		b = self.master.constrain(b, 0, 255)
-		# and to hex form #RRGGBB
-		rgb = f'#{r:02X}{g:02X}{b:02X}'
+		# Convert color from 0..1 (OpenGL) to hex form #RRGGBB
+		rgb = self.master.palette.hex(self.Fire[x][y])
 
 		# In OpenGL there is: glVertex2f(x * STEP - 1, y * STEP - 1.1)
-		# Update coordiantes from 0.. NUMX into 0..WIDTH and NUMY..0 into 0..HEIGHT
+		# Update coordiantes from 0..numx into 0..WIDTH and numy..0 into 0..HEIGHT
 		# OpenGL Y coordinate originates from bottom to top
-		x = self.master.map(x, 0, NUMX, 0, self.master.w)
-		y = self.master.map(y, NUMY, 0, 0, self.master.h)
+		x = self.master.map(x, 0, self.numx, 0, self.master.w)
+		y = self.master.map(y, self.numy, 0, 0, self.master.h)
 		# @2025_02_08_1629 Set fire pixel size dynamically
 		# self.master.setPixel(rgb, x, y, size=20)
-		self.master.setPixel(rgb, x, y, size=self.master.w // 50)
+		self.master.setPixel(rgb, x, y, size=self.master.w // self.numx)
 
 	def MixFire(self):
-		for i in range(1, NUMX - 1):
+		for i in range(1, self.numx - 1):
 			self.Fire[i][0].r = (self.PreF[i - 1].r + self.PreF[i + 1].r + self.PreF[i].r) / 3
 			self.Fire[i][0].g = (self.PreF[i - 1].g + self.PreF[i + 1].g + self.PreF[i].g) / 3
 			self.Fire[i][0].b = (self.PreF[i - 1].b + self.PreF[i + 1].b + self.PreF[i].b) / 3
-		for j in range(1, NUMY - 1):
-				for i in range (1, NUMX - 1):
+		for j in range(1, self.numy - 1):
+				for i in range (1, self.numx - 1):
 					self.Fire[i][j].r = (self.Fire[i-1][j].r + self.Fire[i+1][j].r + self.Fire[i-1][j-1].r + self.Fire[i][j-1].r + self.Fire[i+1][j-1].r + self.Fire[i][j].r) / 5
 					self.Fire[i][j].g = (self.Fire[i-1][j].g + self.Fire[i+1][j].g + self.Fire[i-1][j-1].g + self.Fire[i][j-1].g + self.Fire[i+1][j-1].g + self.Fire[i][j].g) / 5
 					self.Fire[i][j].b = (self.Fire[i-1][j].b + self.Fire[i+1][j].b + self.Fire[i-1][j-1].b + self.Fire[i][j-1].b + self.Fire[i+1][j-1].b + self.Fire[i][j].b) / 5
 
 	def FireUp(self):
-		for j in range(NUMY - 1, 0, -1):
-			for i in range(NUMX):
-				self.Fire[i][j].r = self.Fire[i][j - 1].r - FADE
-				self.Fire[i][j].g = self.Fire[i][j - 1].g - FADE
-				self.Fire[i][j].b = self.Fire[i][j - 1].b - FADE
+		for j in range(self.numy - 1, 0, -1):
+			for i in range(self.numx):
+				self.Fire[i][j].r = self.Fire[i][j - 1].r - self.fade
+				self.Fire[i][j].g = self.Fire[i][j - 1].g - self.fade
+				self.Fire[i][j].b = self.Fire[i][j - 1].b - self.fade
 
 	def DrawFire(self):
-		for j in range(1, NUMY - 1):
-			for i in range(1, NUMX - 1):
+		# Clear all canvas
+		self.master.canvas.delete('all')
+		for j in range(1, self.numy - 1):
+			for i in range(1, self.numx - 1):
 				self.DrawPix(i, j)
 
-	def TickFire(self):
+	def StepFire(self):
+		"""Move fire up and set and mix new bottom rows. Drawing is done by DrawFire"""
+		self.FireUp()
 		self.SetFire()
 		self.MixFire()
-		self.DrawFire()
+
+class FireField:
+	"""The same fire mimic as KrasFire but R/G/B planes are held as NumPy arrays
+		of shape (3, numy, numx) and every frame is drawn as one scaled image"""
+	def __init__(self, master):
+		self.numx, self.numy, self.fade = master.numx, master.numy, master.fade
+		self.PreF = np.zeros((3, self.numx))
+		self.Fire = np.zeros((3, self.numy, self.numx))
+		self.master = master
+		# Random generator seeded from random module so that random.seed() rules it too
+		self.rng = np.random.default_rng(random.getrandbits(32))
+		# SetFire divides green and blue components of random temperature by 1.4 and 2
+		self.tint = np.array([1, 1 / 1.4, 1 / 2])[:, None]
+		# Mixing cells in a row from left to right is the recurrence F[i] = (F[i - 1] + c[i]) / 5.
+		# We solve it in blocks of MIXBLOCK cells by multiplication with lower triangular matrix
+		# of powers of 1/5 and then add last cell of previous block weighted by the same powers.
+		# Influence of cells two blocks away is less than 0.2 ** MIXBLOCK and is neglected
+		k = np.arange(MIXBLOCK)
+		self.mix = np.tril(0.2 ** (np.maximum(np.subtract.outer(k, k), 0) + 1)).T
+		self.carry = 0.2 ** (k + 1)
+		self.blocks = -(-(self.numx - 1) // MIXBLOCK)
+		# Fire pixels 1..numx-2 and 1..numy-2 are put into small image one pixel per cell
+		# and zoomed by Tk into the shown image with cells sizes as in KrasFire.DrawPix
+		w, h = master.w, master.h
+		self.zoomx, self.zoomy = max(w // self.numx, 1), max(h // self.numy, 1)
+		self.header = f'P6 {self.numx - 2} {self.numy - 2} 255 '.encode()
+		self.frame = PhotoImage(master=master.canvas, width=self.numx - 2, height=self.numy - 2)
+		self.image = PhotoImage(master=master.canvas,
+			width=(self.numx - 2) * self.zoomx, height=(self.numy - 2) * self.zoomy)
+		# Bottom fire row 1 ends at the bottom of the canvas
+		self.item = master.canvas.create_image(w // self.numx, h, image=self.image, anchor=SW)
+
+	def SetFire(self):
+		f = self.rng.integers(0, 299, self.numx - 2, endpoint=True) / 100 - 0.8
+		self.PreF[:, 1:-1] = self.tint * f
+
+	def MixFire(self):
+		F = self.Fire
+		F[:, 0, 1:-1] = (self.PreF[:, :-2] + self.PreF[:, 2:] + self.PreF[:, 1:-1]) / 3
+		# Every row is mixed with already mixed row below it, so go row by row
+		for j in range(1, self.numy - 1):
+			row, below = F[:, j], F[:, j - 1]
+			c = row[:, 2:] + below[:, :-2] + below[:, 1:-1] + below[:, 2:] + row[:, 1:-1]
+			# Left border cell enters the recurrence as F[0] = 5 * F[0] / 5
+			t = np.zeros((3, self.blocks * MIXBLOCK))
+			t[:, 0] = row[:, 0] * 5
+			t[:, 1:self.numx - 1] = c
+			t = t.reshape(3, self.blocks, MIXBLOCK) @ self.mix
+			t[:, 1:] += t[:, :-1, -1:] * self.carry
+			row[:, 1:-1] = t.reshape(3, -1)[:, 1:self.numx - 1]
+
+	def FireUp(self):
+		self.Fire[:, 1:] = self.Fire[:, :-1] - self.fade
+
+	def DrawFire(self):
+		""" Draw all fire pixels at once with one put() into the image """
+		# Convert color from 0..1 (OpenGL) to bytes, OpenGL Y coordinate originates from bottom to top
+		rgb = self.master.palette.bytes(self.Fire[:, -2:0:-1, 1:-1])
+		self.frame.put(self.header + rgb.transpose(1, 2, 0).tobytes())
+		self.image.tk.call(self.image, 'copy', self.frame, '-zoom', self.zoomx, self.zoomy)
+
+	def StepFire(self):
 		self.FireUp()
+		self.SetFire()
+		self.MixFire()
 
 class Main:
 	"""Main canvas class where all animation occurs"""
@@ -120,6 +236,8 @@ class Main:
 		self.state = False
 		# Set background for the canvas
 		self.canvas.config(bg=self.options['background'])
+		# Fire colors conversion tables
+		self.palette = FirePalette()
 		# Some mouse event listeners won't work in screensaver mode
 		# but do work in test mode
 		self.canvas.bind('<1>', self.pause)
@@ -187,15 +305,62 @@ class Main:
 		"""Initialise any options"""
 		# Store new width/height of the canvas
 		self.w, self.h = self.canvas.winfo_width(), self.canvas.winfo_height()
+		self.canvas.delete('all')
+		self.fade = FADE
+		self.numx = max(self.options['gridWidth'], 3) if self.options['gridWidth'] else NUMX
+		self.numy = max(self.options['gridHeight'], 3) if self.options['gridHeight'] else NUMY
 		# Light up our olympic fire!
-		self.fire = KrasFire(self)
+		if np is None:
+			# Rectangles renderer draws every cell on its own, so keep it at default grid
+			if (self.numx, self.numy) != (NUMX, NUMY):
+				logger.warning('NumPy is not installed, fire grid %dx%d is ignored, using %dx%d',
+					self.numx, self.numy, NUMX, NUMY)
+				self.numx, self.numy = NUMX, NUMY
+			self.fire = KrasFire(self)
+		elif not self.options['gridWidth'] or not self.options['gridHeight']:
+			self.fire = self.autoFire()
+		else:
+			self.fire = FireField(self)
+
+	def autoFire(self):
+		"""Pick fire grid from screen size and target frame time.
+			Start with AUTOCELL pixels cells and make them larger
+			until fire frame takes no more than frameTime ms but not coarser than NUMX x NUMY.
+			Picked grid is reused for the same canvas size"""
+		key = (self.w, self.h, self.options['gridWidth'], self.options['gridHeight'], self.options['frameTime'])
+		if key in autoGrids:
+			self.numx, self.numy = autoGrids[key]
+			return FireField(self)
+		if not self.options['gridWidth']: self.numx = max(self.w // AUTOCELL, NUMX)
+		if not self.options['gridHeight']: self.numy = max(self.h // AUTOCELL, NUMY)
+		while True:
+			fire = FireField(self)
+			start = time.perf_counter()
+			for _ in range(5):
+				fire.StepFire()
+				fire.DrawFire()
+			spent = (time.perf_counter() - start) * 1000 / 5
+			# Stop when fire is fast enough or every automatic dimension is already at its floor
+			floor = ((self.options['gridWidth'] or self.numx == NUMX)
+				and (self.options['gridHeight'] or self.numy == NUMY))
+			if spent <= self.options['frameTime'] or floor:
+				autoGrids[key] = self.numx, self.numy
+				return fire
+			# Fire frame time grows with number of cells
+			scale = math.sqrt(self.options['frameTime'] / spent)
+			self.canvas.delete(fire.item)
+			if not self.options['gridWidth']: self.numx = max(int(self.numx * scale), NUMX)
+			if not self.options['gridHeight']: self.numy = max(int(self.numy * scale), NUMY)
 
-	def update(self):
-		"""Main update routine"""
+	def step(self, dt):
+		"""Burn fire for one step"""
 		if self.running:
-			# Clear all canvas
-			self.canvas.delete('all')
-			self.fire.TickFire()
+			self.fire.StepFire()
+
+	def render(self):
+		"""Draw fire"""
+		if self.running:
+			self.fire.DrawFire()
 
 class TkScreenSaver:
 	"""Screensaver differs from App that it need not create main toplevel window
@@ -215,17 +380,8 @@ class TkScreenSaver:
 		self.canvas.pack()
 		# Should give Main link to canvas for drawing and options to use
 		self.animate = Main(self.canvas, options)
-		self.run()
-
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move as a rule"""
-		self.animate.update()
-		# Let all windows be updated and handle events
-		self.root.update_idletasks()
-		# Update our window too
-		self.root.update()
-		# 1000 / 25 = 40 fps approximately of course
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.animate.step, self.animate.render)
 
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close (i.e. destroy) window"""
@@ -233,7 +389,7 @@ class TkScreenSaver:
 		# Cancelling all Tk timers to prevent warning messages from Tk
 		# when we destroy window while some timer on it has not been processed yet
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		# We destroy Toplevel window of tkscrsavers.py.
 		# It catches it up to run next screensaver in duty
 		self.root.destroy()
@@ -256,21 +412,14 @@ class App:
 		self.canvas = Canvas(self.win, width=WIDTH, height=HEIGHT)
 		self.canvas.pack()
 		self.animate = Main(self.canvas, options)
-		self.run()
+		self.scheduler = Scheduler(self.win)
+		self.scheduler.start(self.animate.step, self.animate.render)
 		self.win.mainloop()
 
-	def run(self, evt=None):
-		"""Run animation while not window closed or ESC key pressed"""
-		self.animate.update()
-		self.win.update_idletasks()
-		self.win.update()
-		# ~40 fps?
-		self.afterId = self.win.after(25, self.run)
-
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false, stop timer and close window"""
 		self.animate.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Run only if not in module mode
@@ -12,12 +12,23 @@ for tkinter canvas has no alpha channel as far as I could find out.
 Note: it uses font MS Mincho.ttf (https://learn.microsoft.com/en-us/typography/font-list/ms-mincho)
 which should be available on your system while running this app/screensaver.
 Font file MS Mincho.ttf is available with tkscrsavers.py application.
+Other fonts with katakana glyphs are looked for when it is not (see _glyphs.py)
+or font file can be set in fontfile option.
 
 Note: while in test mode pressing Space bar or left mouse click will stop/resume animation.
 """
 
 import random
 from tkinter import *
+try:
+	from ._glyphs import GlyphAtlas
+	from ._colors import gradient
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _glyphs import GlyphAtlas
+	from _colors import gradient
+	from _scheduler import Scheduler
 
 WIDTH = 800
 HEIGHT = 600
@@ -41,53 +52,10 @@ app_options = {
 		'color0': '#90EE90',
 		'color1': '#28A028',
 		'color2': '#28FF28',
+		# Font file name or full path, '' - look for a font with katakana glyphs
+		'fontfile': '',
 }
 
-class GradientColor:
-	"""Static class for creating lists of gradient colors"""
-	@staticmethod
-	def hex_to_RGB(hex):
-		""" "#FFFFFF" -> [255,255,255] """
-		# Pass 16 to the integer function for change of base
-		return [int(hex[i:i+2], 16) for i in range(1, 6, 2)]
-	@staticmethod
-	def RGB_to_hex(RGB):
-		""" [255,255,255] -> "#FFFFFF" """
-		# Components need to be integers for hex to make sense
-		RGB = [int(x) for x in RGB]
-		return "#"+"".join(["0{0:x}".format(v) if v < 16 else
-							"{0:x}".format(v) for v in RGB])
-	@staticmethod
-	def color_dict(gradient):
-		""" Takes in a list of RGB sub-lists and returns dictionary of
-			colors in RGB and hex form for use in a graphing function
-			defined later on """
-		return {"hex": [GradientColor.RGB_to_hex(RGB) for RGB in gradient],
-				"r": [RGB[0] for RGB in gradient],
-				"g": [RGB[1] for RGB in gradient],
-				"b": [RGB[2] for RGB in gradient]}
-	@staticmethod
-	def linear_gradient(start_hex, finish_hex="#FFFFFF", n=10):
-		""" returns a gradient list of (n) colors between
-			two hex colors. start_hex and finish_hex
-			should be the full six-digit color string,
-			inlcuding the number sign ("#FFFFFF") """
-		# Starting and ending colors in RGB form
-		s = GradientColor.hex_to_RGB(start_hex)
-		f = GradientColor.hex_to_RGB(finish_hex)
-		# Initilize a list of the output colors with the starting color
-		RGB_list = [s]
-		# Calcuate a color at each evenly spaced value of t from 1 to n
-		for t in range(1, n):
-			# Interpolate RGB vector for color at the current value of t
-			curr_vector = [
-				int(s[j] + (float(t)/(n-1))*(f[j]-s[j]))
-				for j in range(3)
-			]
-			# Add it to our list of output colors
-			RGB_list.append(curr_vector)
-		return GradientColor.color_dict(RGB_list)
-
 class Symbol:
 	"""Single symbol class"""
 	def __init__(self, app, x, y, speed):
@@ -97,13 +65,19 @@ class Symbol:
 		self.speed = speed
 		self.value = random.choice(app.green_katakana)
 		self.interval = random.randrange(5, 30)
+		# Symbol owns its canvas item and only moves it
+		self.id = app.create_symbol(self.x, self.y, self.value)
+		# Item should show new value on next render
+		self.changed = False
 
-	def draw(self, color):
-		"""Update and draw symbol on the screen"""
+	def step(self, color):
+		"""Change symbol value from time to time and move it down"""
 		if not self.app.ticks % self.interval:
-				self.value = random.choice(self.app.green_katakana if color == 'green' else self.app.lightgreen_katakana)
+			value = random.choice(self.app.green_katakana if color == 'green' else self.app.lightgreen_katakana)
+			if value != self.value:
+				self.value = value
+				self.changed = True
 		self.y = self.y + self.speed if self.y < self.app.h else -self.app.options['fontsize']
-		self.app.create_text(self.x, self.y, self.value[0], self.value[1], self.app.font)
 
 class SymbolColumn:
 	"""Column of symbols class"""
@@ -113,9 +87,9 @@ class SymbolColumn:
 		column_height = random.randrange(8, 24)
 		speed = random.randrange(5, 10)
 		self.symbols = [Symbol(app, x, i, speed) for i in range(y, y - fontsize * column_height, -fontsize - 16)]
-	def draw(self):
-		"""Draw one symbol column"""
-		[symbol.draw('green') if i else symbol.draw('lightgreen') for i, symbol in enumerate(self.symbols)]
+	def step(self):
+		"""Move one symbol column, its first symbol is lighter"""
+		[symbol.step('green') if i else symbol.step('lightgreen') for i, symbol in enumerate(self.symbols)]
 
 class Main:
 	"""Main canvas class"""
@@ -137,6 +111,8 @@ class Main:
 		self.canvas.bind_all('<space>', self.click)
 		self.canvas.bind('<Configure>', self.resize)
 		self.canvas.bind('<Destroy>', self.game_over)
+		# Pre-rendered symbols images if Pillow and font are available
+		self.glyphs = GlyphAtlas(self.canvas, self.options['fontfile'] or None)
 		self.init()
 
 	def toggle_fullscreen(self, evt=None):
@@ -158,9 +134,11 @@ class Main:
 		"""Initialise symbols"""
 		# Get width/height of the canvas
 		self.w, self.h = self.canvas.winfo_width(), self.canvas.winfo_height()
+		self.canvas.delete('all')
 		self.font = ('Ms Mincho.ttf', self.options['fontsize'], 'normal')
+		self.useGlyphs = self.glyphs.available(self.options['fontsize'])
 		katakana = [chr(int('0x30a0', 16) + i) for i in range(96)]
-		colors = GradientColor.linear_gradient(self.options['color1'], self.options['color2'], 30)['hex']
+		colors = gradient(self.options['color1'], self.options['color2'], 30).hex
 		lightgreen = self.options['color0']
 		# self.colors = list(colors['hex'])
 		self.green_katakana = [(char, (40, random.randrange(160, 256), 40)) for char in katakana]
@@ -170,16 +148,37 @@ class Main:
 		self.ticks = 0
 
 	def create_text(self, x, y, text, fill, font, angle=0):
-		self.canvas.create_text(x, y, text=text, fill=fill, font=font, angle=angle, anchor=NW)
-
-	def update(self):
-		"""Main update routine"""
+		return self.canvas.create_text(x, y, text=text, fill=fill, font=font, angle=angle, anchor=NW)
+	def create_symbol(self, x, y, value):
+		"""Create symbol @value (char, color) as glyph image or as text item"""
+		if self.useGlyphs:
+			return self.canvas.create_image(x, y, image=self.glyphs.get(*value, self.options['fontsize']), anchor=NW)
+		return self.create_text(x, y, value[0], value[1], self.font)
+	def symbolOptions(self, value):
+		"""Return itemconfigure options for Tcl script to show symbol @value (char, color)"""
+		if self.useGlyphs:
+			return f'-image {self.glyphs.get(*value, self.options["fontsize"])}'
+		return f'-text {value[0]} -fill {value[1]}'
+
+	def step(self, dt):
+		"""Move all symbol columns one step down"""
 		if self.running:
-			# Clear canvas and draw all symbol columns
-			self.canvas.delete('all')
-			[symbol_column.draw() for symbol_column in self.symbol_columns]
+			[symbol_column.step() for symbol_column in self.symbol_columns]
 			self.ticks += 1
 
+	def render(self):
+		"""Move symbols items and change their values with one Tcl script"""
+		if self.running:
+			path = str(self.canvas)
+			script = []
+			for symbol_column in self.symbol_columns:
+				for symbol in symbol_column.symbols:
+					if symbol.changed:
+						script.append(f'{path} itemconfigure {symbol.id} {self.symbolOptions(symbol.value)}\n')
+						symbol.changed = False
+					script.append(f'{path} coords {symbol.id} {symbol.x} {symbol.y}\n')
+			self.canvas.tk.eval(''.join(script))
+
 	def game_over(self, evt=None):
 		"""Stop animation"""
 		self.running = False
@@ -197,20 +196,14 @@ class TkScreenSaver:
 													bd=0, relief='ridge', highlightthickness=0, cursor='none')
 		self.canvas.pack()
 		self.matrix = Main(self.canvas, options)
-		self.run()
-
-	def run(self, evt=None):
-		"""Running animations while any key pressed or mouse move"""
-		self.matrix.update()
-		self.root.update_idletasks()
-		self.root.update()
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.matrix.step, self.matrix.render)
 
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.matrix.running = False
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.root.destroy()
 
 class App:
@@ -226,20 +219,14 @@ class App:
 		self.canvas = Canvas(self.win, width=WIDTH, height=HEIGHT)
 		self.canvas.pack()
 		self.matrix = Main(self.canvas, options)
-		self.run()
+		self.scheduler = Scheduler(self.win, fps=200)
+		self.scheduler.start(self.matrix.step, self.matrix.render)
 		self.win.mainloop()
 
-	def run(self, evt=None):
-		"""Run animation while not window closed or ESC key pressed"""
-		self.matrix.update()
-		self.win.update_idletasks()
-		self.win.update()
-		self.afterId = self.win.after(5, self.run)
-
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.matrix.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Test app if not in module mode
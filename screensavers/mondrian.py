@@ -12,8 +12,12 @@
 
 # Import needed libraries here, tkinter is a must obviously
 import random
-import math
 from tkinter import *
+try:
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _scheduler import Scheduler
 
 # Default width and height of canvas when testing screensaver.
 # Adjust them to your needs
@@ -48,16 +52,14 @@ class Block:
 		self.colRange = self.randomLengthGen(main.cols + 1)
 		self.rowRange = self.randomLengthGen(main.rows + 1)
 
-		self.block = dict(
-			((i, j), Cell(i * main.wx, j * main.hx, main.wx, main.hx, j)) for i in range(self.colRange[0], self.colRange[1]) for j in range(self.rowRange[0], self.rowRange[1])
-		)
-
-	def display(self):
+	def display(self, image):
+		"""Paint block into @image: cells in its color with black first and last columns"""
 		# strokeWeight(3);
-		for i in range(self.colRange[0], self.colRange[1]):
-			for j in range(self.rowRange[0], self.rowRange[1]):
-				color = 'black' if i == self.colRange[0] or i == self.colRange[1] - 1 else self.c
-				self.block[i, j].displayCell(color, self.main, 3)
+		main = self.main
+		(c0, c1), (r0, r1) = self.colRange, self.rowRange
+		main.paint(image, main.tile(self.c, 3), c0, r0, c1, r1)
+		main.paint(image, main.tile('black', 3), c0, r0, c0 + 1, r1)
+		main.paint(image, main.tile('black', 3), c1 - 1, r0, c1, r1)
 
 	def randomLengthGen(self, length):
 		while True:
@@ -68,6 +70,9 @@ class Block:
 		return (min(a, b), max(a, b))
 
 class Cell:
+	# Cells are created on demand so keep them compact
+	__slots__ = ('x', 'y', 'w', 'h', 'row')
+
 	def __init__(self, x, y, w, h, row):
 		self.x = x
 		self.y = y
@@ -75,13 +80,19 @@ class Cell:
 		self.h = h
 		self.row = row
 
-	def displayCell(self, color, main, width):
-		# drawLine(self, color, x1, y1, x2, y2, **kwargs):
+	def line(self):
+		"""Return the line of the cell as (x1, y1, x2, y2)"""
 		if self.row % 2 == 0:
-			main.drawLine(color, self.x, self.y, self.x + self.w, self.y + self.h, width=width)
-		else:
-			main.drawLine(color, self.x + self.w, self.y, self.x, self.y + self.h, width=width)
+			return self.x, self.y, self.x + self.w, self.y + self.h
+		return self.x + self.w, self.y, self.x, self.y + self.h
 
+	def near(self, px, py, width):
+		"""Is point px, py not farther than width / 2 from the line of the cell (with round caps)"""
+		x1, y1, x2, y2 = self.line()
+		dx, dy = x2 - x1, y2 - y1
+		t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)))
+		ex, ey = x1 + t * dx - px, y1 + t * dy - py
+		return ex * ex + ey * ey <= width * width / 4
 
 class Main:
 	"""Main canvas class where all animation occurs"""
@@ -96,6 +107,11 @@ class Main:
 		self.running = True
 		self.state = False
 		self.timer = None
+		# Idle callback composing next composition
+		self.composing = None
+		# Tiles by (color, width). They depend only on options so they live as long as we do
+		self.tiles = {}
+		self.images = []
 		# Set background for the canvas
 		self.canvas.config(bg=self.options['background'])
 		# Some mouse event listeners won't work in screensaver mode
@@ -113,6 +129,37 @@ class Main:
 		"""Draw a line on the canvas with specified color"""
 		return self.canvas.create_line(x1, y1, x2, y2, capstyle=ROUND, fill=color, **kwargs)
 
+	# Compositions are painted into images by tiling small images of the cells pattern
+	def tile(self, color, width):
+		"""Return image one column wide and three rows high (even, odd, even)
+			of cells lines in color and width over background.
+			Lines of neighbouring cells are taken into account so tiles join seamlessly"""
+		key = (color, width)
+		if key not in self.tiles:
+			wx, hx = self.wx, self.hx
+			bg = self.options['background']
+			rows = []
+			for y in range(hx * 3):
+				row = [color if any(cell.near(x + 0.5, y + 0.5, width) for cell in self.cells(-1, -1, 2, 4)) else bg
+					for x in range(wx)]
+				rows.append('{' + ' '.join(row) + '}')
+			self.tiles[key] = PhotoImage(master=self.canvas, width=wx, height=hx * 3)
+			self.tiles[key].put(' '.join(rows))
+		return self.tiles[key]
+	def cells(self, c0, r0, c1, r1):
+		"""Generate cells from column c0, row r0 to column c1, row r1 (exclusive) on demand"""
+		for i in range(c0, c1):
+			for j in range(r0, r1):
+				yield Cell(i * self.wx, j * self.hx, self.wx, self.hx, j)
+	def paint(self, image, tile, c0, r0, c1, r1):
+		"""Fill cells from column c0, row r0 to column c1, row r1 (exclusive) of image with tile"""
+		x0, y0 = c0 * self.wx, r0 * self.hx
+		x1, y1 = min(c1 * self.wx, self.w), min(r1 * self.hx, self.h)
+		if x0 < x1 and y0 < y1:
+			# Start tiling from an odd row of the tile for odd rows
+			odd = r0 % 2 * self.hx
+			image.tk.call(image, 'copy', tile, '-from', 0, odd, self.wx, odd + self.hx * 2, '-to', x0, y0, x1, y1)
+
 	# Some events bindings
 	def toggle_fullscreen(self, evt=None):
 			"""Event or method: toggle full screen mode"""
@@ -133,6 +180,7 @@ class Main:
 	def game_over(self, evt=None):
 		"""Stop animation. Can be called directly or as an event binding"""
 		if self.timer is not None: self.canvas.after_cancel(self.timer)
+		if self.composing is not None: self.canvas.after_cancel(self.composing)
 		self.running = False
 
 	def init(self):
@@ -144,35 +192,59 @@ class Main:
 		self.hx = self.wx * 2
 		self.cols = self.w // self.wx
 		self.rows = self.h // self.hx
+		# Two images: one is shown while the next composition is prepared in another.
+		# Keep them if canvas size has not changed
+		self.canvas.delete('all')
+		if not self.images or (self.images[0].width(), self.images[0].height()) != (self.w, self.h):
+			self.images = [PhotoImage(master=self.canvas, width=self.w, height=self.h) for _ in range(2)]
+		# Image with prepared composition to be shown next
+		self.current = 0
+		# Image which should be shown on next render if any
+		self.shown = None
+		if self.composing is not None:
+			self.canvas.after_cancel(self.composing)
+			self.composing = None
+		self.item = self.canvas.create_image(0, 0, image=self.images[self.current], anchor=NW)
+		self.compose(self.images[self.current])
+		self.running = True
 
+	def compose(self, image):
+		"""Paint new composition into image"""
 		self.num = random.randint(6, 10)
 		self.blocks = []
 		for i in range(self.num):
 			self.blocks.append(Block(self.options['colors'][i % len(self.options['colors'])], self))
 
-		self.grid = [ [] for _ in range(self.cols) ]
-		for i in range(self.cols):
-			# self.grid[i] = list(range(self.rows))
-			for j in range(self.rows):
-				# self.grid[i][j] = Cell(i * self.wx, j * self.hx, self.wx, self.hx, j)
-				self.grid[i].append(Cell(i * self.wx, j * self.hx, self.wx, self.hx, j))
-		self.running = True
+		image.put(self.options['background'], to=(0, 0, self.w, self.h))
+		self.paint(image, self.tile('white', 1), 0, 0, self.cols, self.rows)
+		for i in range(self.num):
+			self.blocks[i].display(image)
 
-	def update(self):
-		"""Main update routine"""
-		if self.running:
-			# Clear canvas if needed
-			self.canvas.delete('all')
-			for i in range(self.cols):
-				for j in range(self.rows):
-					self.grid[i][j].displayCell('white', self, 1)
+	def next(self):
+		"""Show next composition. Called by timer"""
+		self.running = True
 
-			for i in range(self.num):
-				self.blocks[i].display()
+	def prepare(self):
+		"""Idle callback: compose next composition into the image which is not shown"""
+		self.composing = None
+		self.compose(self.images[self.current])
 
+	def step(self, dt):
+		"""Switch to prepared composition. Does nothing between timer calls"""
+		if self.running:
+			self.shown = self.current
 			self.running = False
 			if self.timer is not None: self.canvas.after_cancel(self.timer)
-			self.timer = self.canvas.after(self.options['timer'] * 1000, self.init)
+			self.timer = self.canvas.after(self.options['timer'] * 1000, self.next)
+
+	def render(self):
+		"""Show prepared composition if it is not shown yet and prepare the next one
+			in another image when Tk is idle, i.e. after the shown one is repainted"""
+		if self.shown is not None:
+			self.canvas.itemconfigure(self.item, image=self.images[self.shown])
+			self.current = 1 - self.shown
+			self.shown = None
+			self.composing = self.canvas.after_idle(self.prepare)
 
 class TkScreenSaver:
 	"""Screensaver differs from App that it need not create main toplevel window
@@ -189,17 +261,8 @@ class TkScreenSaver:
 		self.canvas.pack()
 		# Should give Main link to canvas for drawing and options to use
 		self.animate = Main(self.canvas, options)
-		self.run()
-
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move as a rule"""
-		self.animate.update()
-		# Let all windows be updated and handle events
-		self.root.update_idletasks()
-		# Update our window too
-		self.root.update()
-		# 1000 / 25 = 40 fps approximately of course
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.animate.step, self.animate.render)
 
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close (i.e. destroy) window"""
@@ -207,7 +270,7 @@ class TkScreenSaver:
 		# Cancelling all Tk timers to prevent warning messages from Tk
 		# when we destroy window while some timer on it has not been processed yet
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		# We destroy Toplevel window of tkscrsavers.py.
 		# It catches it up to run next screensaver in duty
 		self.root.destroy()
@@ -226,21 +289,14 @@ class App:
 		self.canvas = Canvas(self.win, width=WIDTH, height=HEIGHT)
 		self.canvas.pack()
 		self.animate = Main(self.canvas, options)
-		self.run()
+		self.scheduler = Scheduler(self.win)
+		self.scheduler.start(self.animate.step, self.animate.render)
 		self.win.mainloop()
 
-	def run(self, evt=None):
-		"""Run animation while not window closed or ESC key pressed"""
-		self.animate.update()
-		self.win.update_idletasks()
-		self.win.update()
-		# ~40 fps?
-		self.afterId = self.win.after(25, self.run)
-
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false, stop timer and close window"""
 		self.animate.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Run only if not in module mode
@@ -10,6 +10,18 @@ by Beotiger @2024_03_31 12:48
 
 import random
 from tkinter import *
+try:
+	from ._colors import gradient
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _colors import gradient
+	from _scheduler import Scheduler
+try:
+	import numpy as np
+except ImportError:
+	# NumPy is optional: without it every drop is a Drop object
+	np = None
 
 WIDTH = 600
 HEIGHT = 800
@@ -25,60 +37,13 @@ app_license = 'MIT'
 app_options = {
 		# Background color
 		'background': 'black',
-		# How many drops we use
+		# How many drops we use (with NumPy tens of thousands make a dense storm)
 		'drops': 200,
 		# Choose random gradient color from color1 to color2
 		'color1': '#1A1BA2',
 		'color2': '#AA2BE2'
 }
 
-class GradientColor:
-	@staticmethod
-	def hex_to_RGB(hex):
-		""" "#FFFFFF" -> [255,255,255] """
-		# Pass 16 to the integer function for change of base
-		return [int(hex[i:i+2], 16) for i in range(1, 6, 2)]
-
-	@staticmethod
-	def RGB_to_hex(RGB):
-		""" [255,255,255] -> "#FFFFFF" """
-		# Components need to be integers for hex to make sense
-		RGB = [int(x) for x in RGB]
-		return "#"+"".join(["0{0:x}".format(v) if v < 16 else
-							"{0:x}".format(v) for v in RGB])
-
-	@staticmethod
-	def color_dict(gradient):
-		""" Takes in a list of RGB sub-lists and returns dictionary of
-			colors in RGB and hex form for use in a graphing function
-			defined later on """
-		return {"hex":[GradientColor.RGB_to_hex(RGB) for RGB in gradient],
-				"r":[RGB[0] for RGB in gradient],
-				"g":[RGB[1] for RGB in gradient],
-				"b":[RGB[2] for RGB in gradient]}
-
-	@staticmethod
-	def linear_gradient(start_hex, finish_hex="#FFFFFF", n=10):
-		""" returns a gradient list of (n) colors between
-			two hex colors. start_hex and finish_hex
-			should be the full six-digit color string,
-			inlcuding the number sign ("#FFFFFF") """
-		# Starting and ending colors in RGB form
-		s = GradientColor.hex_to_RGB(start_hex)
-		f = GradientColor.hex_to_RGB(finish_hex)
-		# Initilize a list of the output colors with the starting color
-		RGB_list = [s]
-		# Calcuate a color at each evenly spaced value of t from 1 to n
-		for t in range(1, n):
-			# Interpolate RGB vector for color at the current value of t
-			curr_vector = [
-				int(s[j] + (float(t)/(n-1))*(f[j]-s[j]))
-				for j in range(3)
-			]
-			# Add it to our list of output colors
-			RGB_list.append(curr_vector)
-		return GradientColor.color_dict(RGB_list)
-
 class Drop:
 	"""Single drop class"""
 	def __init__(self, parent):
@@ -89,18 +54,19 @@ class Drop:
 		self.len = self.map(self.z, 0, 20, 10, 20)
 		self.yspeed = self.map(self.z, 0, 20, 1, 20)
 		self.color = random.choice(self.parent.colors)
+		# z never changes so all of these are computed once
+		self.grav = self.map(self.z, 0, 20, 0, 0.2)
+		self.thick = self.map(self.z, 0, 20, 3, 8)
+		self.respeed = self.map(self.z, 0, 20, 4, 10)
+		# Line of the drop lives as long as the drop does
+		self.id = self.parent.drawLine(self.color, self.x, self.y, self.x, self.y + self.len, width=self.thick)
 
 	def fall(self):
 		self.y = self.y + self.yspeed
-		grav = self.map(self.z, 0, 20, 0, 0.2)
-		self.yspeed = self.yspeed + grav
+		self.yspeed = self.yspeed + self.grav
 		if self.y > self.parent.h:
 			self.y = random.randint(-200, -100)
-			self.yspeed = self.map(self.z, 0, 20, 4, 10)
-
-	def show(self):
-		thick = self.map(self.z, 0, 20, 3, 8)
-		self.parent.drawLine(self.color, self.x, self.y, self.x, self.y + self.len, width=thick)
+			self.yspeed = self.respeed
 
 	# Some utility functions
 	def constrain(self, n, low, high): return max(min(n, high), low)
@@ -111,6 +77,43 @@ class Drop:
 		if start2 < stop2: return self.constrain(newval, start2, stop2)
 		else: return self.constrain(newval, stop2, start2)
 
+class Drops:
+	"""All drops at once as parallel NumPy arrays. The same as Drop objects
+		but every frame falls in one vectorised step"""
+	def __init__(self, parent, n):
+		self.parent = parent
+		# Seed from random module so random.seed() governs both engines
+		self.rng = np.random.default_rng(random.getrandbits(32))
+		self.x = self.rng.integers(0, parent.w, n, endpoint=True).astype(float)
+		self.y = self.rng.integers(-500, -50, n, endpoint=True).astype(float)
+		z = self.rng.integers(0, 20, n, endpoint=True)
+		# The same as Drop.map() for z in [0, 20]
+		self.len = 10 + z * 0.5
+		self.yspeed = 1 + z * 0.95
+		self.grav = z * 0.01
+		self.thick = 3 + z * 0.25
+		self.respeed = 4 + z * 0.3
+		self.color = self.rng.integers(0, len(parent.colors), n)
+		# One line per drop with its color and width set once
+		colors = parent.colors
+		self.ids = [parent.drawLine(colors[color], x, y, x, y + length, width=thick)
+			for x, y, length, thick, color in zip(self.x.tolist(), self.y.tolist(), self.len.tolist(),
+				self.thick.tolist(), self.color.tolist())]
+
+	def fall(self):
+		self.y += self.yspeed
+		self.yspeed += self.grav
+		# Respawn drops which are below the bottom
+		out = self.y > self.parent.h
+		count = int(out.sum())
+		if count:
+			self.y[out] = self.rng.integers(-200, -100, count, endpoint=True)
+			self.yspeed[out] = self.respeed[out]
+
+	def show(self):
+		self.parent.moveLines(zip(self.ids, self.x.astype(int).tolist(), self.y.astype(int).tolist(),
+			self.len.astype(int).tolist()))
+
 class Rain:
 	"""Main rain canvas class - director of all rain drops"""
 	def __init__(self, canvas, options):
@@ -121,8 +124,7 @@ class Rain:
 		for key, val in options.items():
 			self.options[key] = val
 		# create list of gradient colors
-		colors = GradientColor.linear_gradient(self.options['color1'], self.options['color2'], 30)
-		self.colors = list(colors['hex'])
+		self.colors = gradient(self.options['color1'], self.options['color2'], 30).hex
 		# start with running animations
 		self.running = True
 		# For full screen switch
@@ -157,8 +159,13 @@ class Rain:
 		"""Initialise drops"""
 		# Get new width/height of the canvas
 		self.w, self.h = self.canvas.winfo_width(), self.canvas.winfo_height()
+		# Remove lines of previous drops
+		self.canvas.delete('all')
 		self.drops = []
-		[self.drops.append(Drop(self)) for _ in range(self.options['drops'])]
+		# Use arrays of drops if NumPy is installed
+		self.engine = Drops(self, self.options['drops']) if np is not None else None
+		if self.engine is None:
+			[self.drops.append(Drop(self)) for _ in range(self.options['drops'])]
 		# for _ in range(self.options['drops']):
 		# 	self.drops.append(Drop(self))
 
@@ -166,14 +173,29 @@ class Rain:
 		"""Draw a line on the canvas with specified color"""
 		return self.canvas.create_line(x1, y1, x2, y2, capstyle=ROUND, fill=color, **kwargs)
 
-	def update(self):
-		"""Rain update routine"""
+	def moveLines(self, lines):
+		"""Move drops lines given as (id, x, y, length) in whole pixels to their new places.
+			All moves are sent to Tcl as one script instead of a coords call per line"""
+		path = str(self.canvas)
+		self.canvas.tk.eval(''.join([f'{path} coords {id} {x} {y} {x} {y + length}\n'
+			for id, x, y, length in lines]))
+
+	def step(self, dt):
+		"""Let all drops fall for one frame"""
 		if self.running:
-			# Clear canvas
-			self.canvas.delete('all')
-			for drop in self.drops:
-				drop.fall()
-				drop.show()
+			if self.engine is not None:
+				self.engine.fall()
+			else:
+				for drop in self.drops:
+					drop.fall()
+
+	def render(self):
+		"""Move drops lines to where drops are"""
+		if self.running:
+			if self.engine is not None:
+				self.engine.show()
+			else:
+				self.moveLines((drop.id, drop.x, int(drop.y), int(drop.len)) for drop in self.drops)
 
 	def game_over(self, evt=None):
 		"""Stop animations"""
@@ -192,20 +214,14 @@ class TkScreenSaver:
 													bd=0, relief='ridge', highlightthickness=0, cursor='none')
 		self.canvas.pack()
 		self.rain = Rain(self.canvas, options)
-		self.run()
-
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move"""
-		self.rain.update()
-		self.root.update_idletasks()
-		self.root.update()
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.rain.step, self.rain.render)
 
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.rain.running = False
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.root.destroy()
 
 
@@ -222,21 +238,14 @@ class App:
 		self.canvas = Canvas(self.win, width=WIDTH, height=HEIGHT)
 		self.canvas.pack()
 		self.rain = Rain(self.canvas, options)
-		self.run()
+		self.scheduler = Scheduler(self.win)
+		self.scheduler.start(self.rain.step, self.rain.render)
 		self.win.mainloop()
 
-	def run(self, evt=None):
-		"""Run animation while not window closed or ESC key pressed"""
-		self.rain.update()
-		self.win.update_idletasks()
-		self.win.update()
-		# 40 fps? )
-		self.afterId = self.win.after(25, self.run)
-
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.rain.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Test application when run directly
@@ -13,6 +13,11 @@ Adapted 2024_03_30 18:42 by Beotiger
 import math
 from datetime import datetime
 from tkinter import *
+try:
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _scheduler import Scheduler
 
 WIDTH = 900
 HEIGHT = 600
@@ -34,20 +39,49 @@ app_options = {
 	'circles': 3
 }
 
+# Cosines and sines of all angles in degrees the label moves through
+COS = [math.cos(math.radians(angle)) for angle in range(360)]
+SIN = [math.sin(math.radians(angle)) for angle in range(360)]
+
+def createLabel(self, master, options, **kwargs):
+	"""Create label with its font set once. @self must be App or TkScreenSaver instance"""
+	self.label = Label(master, fg = options['foreground_color'], bg = options['background'],
+		font = (options['font_family'], options['font_size']), **kwargs)
+	# Text shown and sizes of the label: they are changed only when needed
+	self.text = None
+	self.labelSize = (1, 1)
+	self.label.bind('<Configure>', lambda evt: setattr(self, 'labelSize', (evt.width, evt.height)))
+
 def showLabel(self):
 	"""Show label on the screen in position that depends on passed frames.
 	angle is 90 +/- fps: it's because radians begin from +quarter of circle and we want it to start from 0°.
 		@self must be App or TkScreenSaver instance
 	"""
-	angle = math.radians((self.fps + 90) % 360) if self.dir else math.radians((90 - self.fps) % 360)
-	self.label.configure(text=datetime.now().strftime(self.options['time_format']))
-	self.label['font'] = (self.options['font_family'], self.options['font_size'])
+	angle = (self.fps + 90) % 360 if self.dir else (90 - self.fps) % 360
+	# Text changes about once a second so do not make Tk render it anew every frame
+	text = datetime.now().strftime(self.options['time_format'])
+	if text != self.text:
+		self.text = text
+		self.label.configure(text=text)
 	# Sizes of text label can change every time depending on datetime format pattern
-	w2, h2 = self.label.winfo_width(), self.label.winfo_height()
-	x = (self.wd2 - w2 / 2) + (self.wd2 - w2) * math.cos(angle)
-	y = (self.ht2 - h2 / 2) + (self.ht2 - h2) * math.sin(angle)
+	w2, h2 = self.labelSize
+	x = (self.wd2 - w2 / 2) + (self.wd2 - w2) * COS[angle]
+	y = (self.ht2 - h2 / 2) + (self.ht2 - h2) * SIN[angle]
 	self.label.place(x=x, y=y, relwidth=0.9, relheight=0.9)
 
+def step(self, dt):
+	"""Move label by one degree and change direction on full circles.
+		@self must be App or TkScreenSaver instance
+	"""
+	if self.running:
+		self.fps += 1
+		# Change direction on full circle
+		if self.fps % 360 == 0:
+			self.circs += 1
+			if self.circs >= self.options['circles']:
+				self.circs = 0
+				self.dir = not self.dir
+
 def resize(self):
 	"""Resize event. @self must be App or TkScreenSaver instance"""
 	nw, nh = self.frame.master.winfo_width(), self.frame.master.winfo_height()
@@ -79,27 +113,16 @@ class TkScreenSaver:
 				height = self.monitor.height
 		)
 		self.frame.pack(expand=True, fill=X)
-		self.label = Label(self.frame, cursor = 'none', fg = options['foreground_color'], bg = options['background'])
+		createLabel(self, self.frame, options, cursor = 'none')
 		self.options = options
 		self.running = True
-		self.run()
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move"""
-		if self.running:
-			showLabel(self)
-			self.fps += 1
-			# Change direction on full circle
-			if self.fps % 360 == 0:
-					self.circs += 1
-					if self.circs >= self.options['circles']:
-						self.circs = 0
-						self.dir = not self.dir
-			self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(lambda dt: step(self, dt), lambda: showLabel(self))
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.running = False
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.root.destroy()
 
 class App:
@@ -113,7 +136,7 @@ class App:
 			self.win.update_idletasks()
 			self.frame = Frame(self.win, background=options['background'], width=WIDTH, height=HEIGHT)
 			self.frame.pack(expand=True, fill=X)
-			self.label = Label(self.frame, fg = options['foreground_color'], bg = options['background'])
+			createLabel(self, self.frame, options)
 			# @2024_03_04_2050 get the halves of monitor sizes
 			self.wd, self.ht = self.win.winfo_width(), self.win.winfo_height()
 			self.wd2, self.ht2 = self.wd // 2, self.ht // 2
@@ -131,24 +154,13 @@ class App:
 			self.running = True
 			self.state = False
 			self.win.grab_set()
-			self.run()
+			self.scheduler = Scheduler(self.win)
+			self.scheduler.start(lambda dt: step(self, dt), lambda: showLabel(self))
 			self.win.mainloop()
-	def run(self, evt=None):
-			"""Run animation while not window closed or ESC key pressed"""
-			if self.running:
-				showLabel(self)
-				self.fps += 1
-				# Change direction on full circle
-				if self.fps % 360 == 0:
-					self.circs += 1
-					if self.circs >= self.options['circles']:
-						self.circs = 0
-						self.dir = not self.dir
-			self.afterId = self.win.after(25, self.run)
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 	def toggle_fullscreen(self, evt=None):
 			"""Toggle full screen mode"""
@@ -10,6 +10,13 @@ Note: while in test mode pressing Space bar or left mouse click will stop/resume
 import math
 import random
 from tkinter import *
+try:
+	from ._colors import gradient
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _colors import gradient
+	from _scheduler import Scheduler
 
 WIDTH = 800
 HEIGHT = 800
@@ -63,51 +70,6 @@ class Vector:
 		else: v = self
 		return v
 
-class GradientColor:
-	"""Static class for creating lists of gradient colors"""
-	@staticmethod
-	def hex_to_RGB(hex):
-		""" "#FFFFFF" -> [255,255,255] """
-		# Pass 16 to the integer function for change of base
-		return [int(hex[i:i+2], 16) for i in range(1, 6, 2)]
-	@staticmethod
-	def RGB_to_hex(RGB):
-		""" [255,255,255] -> "#FFFFFF" """
-		# Components need to be integers for hex to make sense
-		RGB = [int(x) for x in RGB]
-		return "#"+"".join(["0{0:x}".format(v) if v < 16 else
-							"{0:x}".format(v) for v in RGB])
-	@staticmethod
-	def color_dict(gradient):
-		""" Takes in a list of RGB sub-lists and returns dictionary of
-			colors in RGB and hex form for use in a graphing function
-			defined later on """
-		return {"hex": [GradientColor.RGB_to_hex(RGB) for RGB in gradient],
-				"r": [RGB[0] for RGB in gradient],
-				"g": [RGB[1] for RGB in gradient],
-				"b": [RGB[2] for RGB in gradient]}
-	@staticmethod
-	def linear_gradient(start_hex, finish_hex="#FFFFFF", n=10):
-		""" returns a gradient list of (n) colors between
-			two hex colors. start_hex and finish_hex
-			should be the full six-digit color string,
-			inlcuding the number sign ("#FFFFFF") """
-		# Starting and ending colors in RGB form
-		s = GradientColor.hex_to_RGB(start_hex)
-		f = GradientColor.hex_to_RGB(finish_hex)
-		# Initilize a list of the output colors with the starting color
-		RGB_list = [s]
-		# Calcuate a color at each evenly spaced value of t from 1 to n
-		for t in range(1, n):
-			# Interpolate RGB vector for color at the current value of t
-			curr_vector = [
-				int(s[j] + (float(t)/(n-1))*(f[j]-s[j]))
-				for j in range(3)
-			]
-			# Add it to our list of output colors
-			RGB_list.append(curr_vector)
-		return GradientColor.color_dict(RGB_list)
-
 class Star:
 	"""Individual Star class"""
 	def __init__(self, parent, x, y, color='white'):
@@ -115,15 +77,25 @@ class Star:
 		self.pos = Vector(x , y)
 		self.prevPos = Vector(x , y)
 		self.vel = Vector()
+		self.width = self.parent.options['starWidth']
+		self.reset(x, y, color)
+
+	def reset(self, x, y, color='white'):
+		"""Start star anew at (x, y) reusing its vectors"""
+		self.pos.x = self.prevPos.x = x
+		self.pos.y = self.prevPos.y = y
+		self.vel.x = self.vel.y = 0
 		self.ang = math.atan2(y - self.parent.h / 2, x - self.parent.w / 2)
+		# Direction never changes so keep it
+		self.cos, self.sin = math.cos(self.ang), math.sin(self.ang)
 		self.color = color
-		self.width = self.parent.options['starWidth']
 
 	def update(self, acc):
-		self.vel.x += math.cos(self.ang) * acc
-		self.vel.y += math.sin(self.ang) * acc
-		self.prevPos = Vector(self.pos.x, self.pos.y)
-		self.pos = self.pos.add(self.vel)
+		self.vel.x += self.cos * acc
+		self.vel.y += self.sin * acc
+		self.prevPos.x, self.prevPos.y = self.pos.x, self.pos.y
+		self.pos.x += self.vel.x
+		self.pos.y += self.vel.y
 
 	def draw(self):
 		"""Draw star as a line from pos to prevPos"""
@@ -147,7 +119,7 @@ class Starfield:
 			self.options[key] = val
 		self.mousePos = None
 		# Choose one of the color in palette in colo rmode
-		self.colors = GradientColor.linear_gradient(self.options['color1'], self.options['color2'], 50)['hex']
+		self.colors = gradient(self.options['color1'], self.options['color2'], 50).hex
 		self.canvas = canvas
 		self.state = False
 		# Set background for the canvas
@@ -201,38 +173,44 @@ class Starfield:
 		# Inner frames counter
 		self.counter = 0
 		self.forward = 1
-		self.step = 0.01
+		self.accStep = 0.01
 		# Get new width/height of the canvas
 		self.w, self.h = self.canvas.winfo_width(), self.canvas.winfo_height()
 		self.numStars = self.options['numstars']
+		# Stars pool: stars which leave the screen are started anew in place
 		self.stars = []
 		for _ in range(self.numStars):
 			self.newStar()
 
-	def newStar(self, position=None):
-		"""Add new star at position"""
+	def newStar(self, position=None, star=None):
+		"""Add new star at position or restart @star there if given"""
 		if position is None:
 			position = Vector(random.randint(0, self.w), random.randint(0, self.h))
-		self.stars.append(Star(self, position.x, position.y, random.choice(self.colors)))
+		if star is None:
+			self.stars.append(Star(self, position.x, position.y, random.choice(self.colors)))
+		else:
+			star.reset(position.x, position.y, random.choice(self.colors))
 
-	def update(self):
-		"""Main update routine"""
+	def step(self, dt):
+		"""Accelerate and move stars, restart those which left the screen"""
 		if self.running:
-			# Clear canvas
-			self.canvas.delete('all')
 			# Stars acceleration
-			self.counter += self.forward * self.step
-			self.step += self.forward * 0.0005
+			self.counter += self.forward * self.accStep
+			self.accStep += self.forward * 0.0005
 			if self.counter > 2.0 or self.counter < 0: self.forward *= -1
 			acc = self.counter if self.options['cycled'] else self.options['acceleration']
 			acc = self.map(self.mousePos.x, 0, self.w, 0.0025, 2.9) if self.mousePos is not None else acc
 			# print('acc=', acc)
-			for star in self.stars[:]:
-				star.draw()
+			for star in self.stars:
 				star.update(acc)
-				if not star.isActive(): self.stars.remove(star)
-			while len(self.stars) < self.numStars:
-				self.newStar()
+				if not star.isActive(): self.newStar(star=star)
+
+	def render(self):
+		"""Draw all stars anew"""
+		if self.running:
+			self.canvas.delete('all')
+			for star in self.stars:
+				star.draw()
 
 	def game_over(self, evt=None):
 		"""Stop animations"""
@@ -251,20 +229,14 @@ class TkScreenSaver:
 													bd=0, relief='ridge', highlightthickness=0, cursor='none')
 		self.canvas.pack()
 		self.starfield = Starfield(self.canvas, options)
-		self.run()
-
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move"""
-		self.starfield.update()
-		self.root.update_idletasks()
-		self.root.update()
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.starfield.step, self.starfield.render)
 
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.starfield.game_over()
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.root.destroy()
 
 class App:
@@ -281,21 +253,14 @@ class App:
 		self.canvas.pack()
 		self.starfield = Starfield(self.canvas, options)
 		self.win.protocol('WM_DELETE_WINDOW', self.fin)
-		self.run()
+		self.scheduler = Scheduler(self.win)
+		self.scheduler.start(self.starfield.step, self.starfield.render)
 		self.win.mainloop()
 
-	def run(self, evt=None):
-		"""Run animation while not window closed or ESC key pressed"""
-		self.starfield.update()
-		self.win.update_idletasks()
-		self.win.update()
-		# 40 fps? )
-		self.afterId = self.win.after(25, self.run)
-
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.starfield.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Run test if not in module mode
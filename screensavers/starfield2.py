@@ -11,10 +11,25 @@ Note: while in test mode pressing Space bar or left mouse click
 # Import needed libraries here, tkinter is a must obviously
 import random
 from tkinter import *
+try:
+	from ._colors import gradient
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _colors import gradient
+	from _scheduler import Scheduler
+try:
+	import numpy as np
+except ImportError:
+	# NumPy is optional: without it every star is a Star object
+	np = None
 
 # Default width and height of canvas when testing screensaver.
 # Adjust them to your needs
 WIDTH, HEIGHT = 600, 600
+# Star radiuses are split into so many depth buckets.
+# Star tail width is changed only when its star moves to another bucket
+DEPTH_BUCKETS = 8
 
 # Default screensaver settings.
 # They are used in tkscrsavers.py so we should not change their names
@@ -43,59 +58,16 @@ app_options = {
 	'showTails': True,
 }
 
-class GradientColor:
-	"""Static class for creating lists of gradient colors"""
-	@staticmethod
-	def hex_to_RGB(hex):
-		""" "#FFFFFF" -> [255,255,255] """
-		# Pass 16 to the integer function for change of base
-		return [int(hex[i:i+2], 16) for i in range(1, 6, 2)]
-	@staticmethod
-	def RGB_to_hex(RGB):
-		""" [255,255,255] -> "#FFFFFF" """
-		# Components need to be integers for hex to make sense
-		RGB = [int(x) for x in RGB]
-		return "#"+"".join(["0{0:x}".format(v) if v < 16 else
-							"{0:x}".format(v) for v in RGB])
-	@staticmethod
-	def color_dict(gradient):
-		""" Takes in a list of RGB sub-lists and returns dictionary of
-			colors in RGB and hex form for use in a graphing function
-			defined later on """
-		return {"hex": [GradientColor.RGB_to_hex(RGB) for RGB in gradient],
-				"r": [RGB[0] for RGB in gradient],
-				"g": [RGB[1] for RGB in gradient],
-				"b": [RGB[2] for RGB in gradient]}
-	@staticmethod
-	def linear_gradient(start_hex, finish_hex="#FFFFFF", n=10):
-		""" returns a gradient list of (n) colors between
-			two hex colors. start_hex and finish_hex
-			should be the full six-digit color string,
-			inlcuding the number sign ("#FFFFFF") """
-		# Starting and ending colors in RGB form
-		s = GradientColor.hex_to_RGB(start_hex)
-		f = GradientColor.hex_to_RGB(finish_hex)
-		# Initilize a list of the output colors with the starting color
-		RGB_list = [s]
-		# Calcuate a color at each evenly spaced value of t from 1 to n
-		for t in range(1, n):
-			# Interpolate RGB vector for color at the current value of t
-			curr_vector = [
-				int(s[j] + (float(t)/(n-1))*(f[j]-s[j]))
-				for j in range(3)
-			]
-			# Add it to our list of output colors
-			RGB_list.append(curr_vector)
-		return GradientColor.color_dict(RGB_list)
-
 class Star:
-	def __init__(self, app, color):
+	def __init__(self, app, color, index):
 		self.x = random.randint(-app.w, app.w)
 		self.y = random.randint(-app.h, app.h)
 		self.z = random.randint(0, app.w)
 		self.pz = self.z
 		self.app = app
 		self.color = color if app.options['colorMode'] else 'white'
+		# Number of the star to draw it with its own canvas items
+		self.index = index
 
 	def update(self, speed):
 		self.z = self.z - speed
@@ -109,14 +81,59 @@ class Star:
 		sx = self.app.map(self.x / self.z, 0, 1, 0, self.app.w)
 		sy = self.app.map(self.y / self.z, 0, 1, 0, self.app.h)
 		r = self.app.map(self.z, 0, self.app.w, 16, 0)
-		self.app.circle(self.color, sx, sy, r, width=0)
 		if self.app.options['showTails']:
 			px = self.app.map(self.x / self.pz, 0, 1, 0, self.app.w)
 			py = self.app.map(self.y / self.pz, 0, 1, 0, self.app.h)
-			self.pz = self.z
-			self.app.drawLine(self.color, px, py, sx, sy, width=r / 3)
+			self.app.drawStar(self.index, self.color, sx, sy, r, px, py)
 		else:
-			self.pz = self.z
+			self.app.drawStar(self.index, self.color, sx, sy, r)
+		self.pz = self.z
+
+class Stars:
+	"""All stars at once as NumPy arrays. Moves and projects them the same way
+		as Star objects do but in one vectorised pass per frame"""
+	def __init__(self, app, n):
+		self.app = app
+		self.n = n
+		# Seed from random module so random.seed() governs both engines
+		self.rng = np.random.default_rng(random.getrandbits(32))
+		self.x = self.rng.integers(-app.w, app.w, n, endpoint=True).astype(float)
+		self.y = self.rng.integers(-app.h, app.h, n, endpoint=True).astype(float)
+		self.z = self.rng.integers(0, app.w, n, endpoint=True).astype(float)
+		self.pz = self.z.copy()
+		if app.options['colorMode']:
+			self.colors = [random.choice(app.colors) for _ in range(n)]
+		else:
+			self.colors = ['white'] * n
+
+	def update(self, speed):
+		self.z -= speed
+		# Respawn stars which passed by us
+		out = self.z < 1
+		count = int(out.sum())
+		if count:
+			self.z[out] = self.pz[out] = self.app.w
+			self.x[out] = self.rng.integers(-self.app.w, self.app.w, count, endpoint=True)
+			self.y[out] = self.rng.integers(-self.app.h, self.app.h, count, endpoint=True)
+
+	def project(self):
+		"""Return screen coordinates of stars, their radiuses and tails starts
+			as arrays sx, sy, r, px, py"""
+		w, h = self.app.w, self.app.h
+		sx, sy = self.x / self.z * w, self.y / self.z * h
+		r = 16 - self.z * (16 / w)
+		px, py = self.x / self.pz * w, self.y / self.pz * h
+		self.pz[:] = self.z
+		return sx, sy, r, px, py
+
+	def show(self):
+		sx, sy, r, px, py = self.project()
+		if self.app.options['showTails']:
+			for star in zip(range(self.n), self.colors, sx.tolist(), sy.tolist(), r.tolist(), px.tolist(), py.tolist()):
+				self.app.drawStar(*star)
+		else:
+			for star in zip(range(self.n), self.colors, sx.tolist(), sy.tolist(), r.tolist()):
+				self.app.drawStar(*star)
 
 class Main:
 	"""Main canvas class where all animation occurs"""
@@ -144,7 +161,7 @@ class Main:
 		# For translating coordinates set to zero
 		self.startX, self.startY = 0, 0
 		# If use colors we will use gradint color from color1 to color2
-		self.colors = GradientColor.linear_gradient(self.options['color1'], self.options['color2'], 50)['hex']
+		self.colors = gradient(self.options['color1'], self.options['color2'], 50).hex
 		# Run init animation at first time
 		self.init()
 
@@ -172,6 +189,26 @@ class Main:
 		return self.canvas.create_oval(
 				self.startX + x - r, self.startY + y - r,
 				self.startX + x + r, self.startY + y + r, fill=color, **kwargs)
+	def drawStar(self, i, color, sx, sy, r, px=None, py=None):
+		"""Draw star number i at sx, sy with radius r and its tail from px, py if given.
+			Items of the star are created once and then only moved.
+			Moves are collected in self.script and sent to Tcl by update at once"""
+		bucket = min(int(r * DEPTH_BUCKETS / 16), DEPTH_BUCKETS - 1)
+		if i == len(self.ovals):
+			self.ovals.append(self.circle(color, sx, sy, r, width=0))
+			self.tails.append(self.drawLine(color, px, py, sx, sy, width=self.tailWidth(bucket)) if px is not None else None)
+			self.buckets.append(bucket)
+			return
+		x, y = self.startX + sx, self.startY + sy
+		self.script.append(f'{self.path} coords {self.ovals[i]} {x - r:.1f} {y - r:.1f} {x + r:.1f} {y + r:.1f}\n')
+		if px is not None:
+			self.script.append(f'{self.path} coords {self.tails[i]} {self.startX + px:.1f} {self.startY + py:.1f} {x:.1f} {y:.1f}\n')
+			if bucket != self.buckets[i]:
+				self.buckets[i] = bucket
+				self.script.append(f'{self.path} itemconfigure {self.tails[i]} -width {self.tailWidth(bucket)}\n')
+	def tailWidth(self, bucket):
+		"""Width of star tails in depth bucket. It is a third of middle radius of the bucket"""
+		return (bucket + 0.5) * 16 / DEPTH_BUCKETS / 3
 	def translate(self, x, y):
 		"""Translates start of axises to x, y"""
 		self.startX, self.startY = x, y
@@ -211,19 +248,38 @@ class Main:
 		self.mouseX = None
 		# Create 800 stars
 		self.stars = []
-		[self.stars.append(Star(self, random.choice(self.colors))) for _ in range(self.options['stars'])]
+		# Use arrays of stars if NumPy is installed
+		self.engine = Stars(self, self.options['stars']) if np is not None else None
+		if self.engine is None:
+			[self.stars.append(Star(self, random.choice(self.colors), i)) for i in range(self.options['stars'])]
+		# Canvas items of stars and tails, and depth buckets of stars by their numbers
+		self.canvas.delete('all')
+		self.ovals, self.tails, self.buckets = [], [], []
+		# Tcl commands to move star items in current frame
+		self.path = str(self.canvas)
+		self.script = []
 		# Move the beginning of coordinates to the center of the window
 		self.translate(self.w / 2, self.h / 2)
 
-	def update(self):
-		"""Main update routine"""
+	def step(self, dt):
+		"""Fly through stars, mouse position sets speed if it is over canvas"""
 		if self.running:
-			# Clear canvas if needed
-			self.canvas.delete('all')
 			speed = self.map(self.mouseX, 0, self.w, 0, 50) if self.mouseX else self.options['speed']
-			for i in range(self.options['stars']):
-				self.stars[i].update(speed)
-				self.stars[i].show()
+			if self.engine is not None:
+				self.engine.update(speed)
+			for star in self.stars:
+				star.update(speed)
+
+	def render(self):
+		"""Move stars items to their projections and send all changes to Tk at once"""
+		if self.running:
+			if self.engine is not None:
+				self.engine.show()
+			for star in self.stars:
+				star.show()
+			if self.script:
+				self.canvas.tk.eval(''.join(self.script))
+				self.script.clear()
 
 class TkScreenSaver:
 	"""Screensaver"""
@@ -236,20 +292,14 @@ class TkScreenSaver:
 													bd=0, relief='ridge', highlightthickness=0, cursor='none')
 		self.canvas.pack()
 		self.animate = Main(self.canvas, options)
-		self.run()
-
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move as a rule"""
-		self.animate.update()
-		self.root.update_idletasks()
-		self.root.update()
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.animate.step, self.animate.render)
 
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close (i.e. destroy) window"""
 		self.animate.running = False
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.root.destroy()
 
 class App:
@@ -264,20 +314,14 @@ class App:
 		self.canvas = Canvas(self.win, width=WIDTH, height=HEIGHT)
 		self.canvas.pack()
 		self.animate = Main(self.canvas, options)
-		self.run()
+		self.scheduler = Scheduler(self.win)
+		self.scheduler.start(self.animate.step, self.animate.render)
 		self.win.mainloop()
 
-	def run(self, evt=None):
-		"""Run animation while not window closed or ESC key pressed"""
-		self.animate.update()
-		self.win.update_idletasks()
-		self.win.update()
-		self.afterId = self.win.after(25, self.run)
-
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false, stop timer and close window"""
 		self.animate.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Run only if not in module mode
@@ -21,8 +21,20 @@ And right mouse click will turn on/off debug mode for one vehicle under mouse cu
 """
 
 from tkinter import *
+try:
+	from ._colors import gradient
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _colors import gradient
+	from _scheduler import Scheduler
 import random
 import math
+try:
+	import numpy as np
+except ImportError:
+	# NumPy is optional: without it only scalar engine is available
+	np = None
 
 # Default width and height of canvas when testing screensaver
 WIDTH = 800
@@ -61,7 +73,9 @@ app_options = {
 	# Color of poison
 	'poisonColor': '#FF0000',
 	# If we want more info about every vehicle... Answer: No)
-	'debug': False
+	'debug': False,
+	# Simulation engine: 'scalar' (Vehicle objects) or 'array' (NumPy arrays, if available)
+	'engine': 'scalar'
 }
 
 class Vector:
@@ -97,53 +111,6 @@ class Vector:
 	def __str__(self) -> str:
 		return f'Vector({round(self.x, 2)}, {round(self.y, 2)})'
 
-class GradientColor:
-	@staticmethod
-	def hex_to_RGB(hex):
-		""" '#FFFFFF' -> [255,255,255] """
-		# Pass 16 to the integer function for change of base
-		return [int(hex[i:i+2], 16) for i in range(1, 6, 2)]
-
-	@staticmethod
-	def RGB_to_hex(RGB):
-		""" [255,255,255] -> '#FFFFFF' """
-		# Components need to be integers for hex to make sense
-		RGB = [int(x) for x in RGB]
-		return "#"+"".join(["0{0:x}".format(v) if v < 16 else
-							"{0:x}".format(v) for v in RGB])
-
-	@staticmethod
-	def color_dict(gradient):
-		"""Takes in a list of RGB sub-lists and returns dictionary of
-			colors in RGB and hex form for use in a graphing function
-			defined later on"""
-		return {"hex":[GradientColor.RGB_to_hex(RGB) for RGB in gradient],
-				"r":[RGB[0] for RGB in gradient],
-				"g":[RGB[1] for RGB in gradient],
-				"b":[RGB[2] for RGB in gradient]}
-
-	@staticmethod
-	def linear_gradient(start_hex, finish_hex="#FFFFFF", n=10):
-		"""Returns a gradient list of (n) colors between
-			two hex colors. start_hex and finish_hex
-			should be the full six-digit color string,
-			inlcuding the number sign ("#FFFFFF")"""
-		# Starting and ending colors in RGB form
-		s = GradientColor.hex_to_RGB(start_hex)
-		f = GradientColor.hex_to_RGB(finish_hex)
-		# Initilize a list of the output colors with the starting color
-		RGB_list = [s]
-		# Calcuate a color at each evenly spaced value of t from 1 to n
-		for t in range(1, n):
-			# Interpolate RGB vector for color at the current value of t
-			curr_vector = [
-				int(s[j] + (float(t)/(n-1))*(f[j]-s[j]))
-				for j in range(3)
-			]
-			# Add it to our list of output colors
-			RGB_list.append(curr_vector)
-		return GradientColor.color_dict(RGB_list)
-
 class Vehicle:
 	"""Individual vehicle class"""
 	def __init__(self, app, x, y, dna=None):
@@ -222,18 +189,19 @@ class Vehicle:
 		self.applyForce(steerB.mult(self.dna[1]))
 
 	def eat(self, foodpois, nutrition, perception):
-		"""Search and eat food/poison as foodpois"""
+		"""Search and eat food/poison as foodpois (FoodGrid)"""
 		record = 1000000 # Maximum number we can afford
 		closest = None
-		for i in range(len(foodpois) - 1, -1, -1):
-			d = self.pos.dist(foodpois[i])
+		# Only items within eating distance or perception matter
+		for item in foodpois.near(self.pos, max(perception, self.maxspeed)):
+			d = self.pos.dist(item)
 			if d < self.maxspeed:
-				foodpois.pop(i)
+				foodpois.remove(item)
 				self.health += nutrition
 			else:
 				if d < record and d < perception:
 					record = d
-					closest = foodpois[i]
+					closest = item
 					# print(f'Found closest={closest}')
 		# This is the moment of eating!
 		if closest != None:
@@ -254,35 +222,7 @@ class Vehicle:
 		return self.health <= 0
 
 	def draw(self):
-		# Draw a triangle rotated in the direction of velocity
-		heading = self.velocity.heading()
-		angle = math.degrees(heading) + 90 # + math.pi / 2
-		# print(f'Velocity={self.velocity}')
-		# print(f'angle={round(angle, 1)}°')
-		# vehicle radius
-		"""push()
-		translate(self.pos.x, self.pos.y)
-		rotate(angle)"""
-		if self.app.options['debug'] or self.selected:
-			# Radians start counting from east not north side of the circle
-			rangle = math.radians(angle) + math.pi / 2
-			fc = self.app.options['foodColor']
-			pc = self.app.options['poisonColor']
-			self.app.drawLine(fc, self.pos.x, self.pos.y, self.pos.x, self.pos.y - self.dna[0] * 25, rangle, width=3)
-			self.app.create_circle(self.pos.x, self.pos.y, self.dna[2] * 2, outline=fc, width=2)
-			self.app.drawLine(pc, self.pos.x, self.pos.y, self.pos.x, self.pos.y - self.dna[1] * 25, rangle, width=2)
-			self.app.create_circle(self.pos.x, self.pos.y, self.dna[3] * 2, outline=pc, width=2)
-
-		hlt = int(self.health * 100) % 101
-		color = self.app.colors[hlt]
-		# Shrink vehicles angle when they are too fast
-		phi = self.phi - self.velocity.mag() * 5 if self.app.options['shrink'] else self.phi
-		if phi < 5: phi = 5 # 5 degrees is a minimum
-		# Angle of our triangle in degrees
-		self.app.drawTri(color, self.pos.x, self.pos.y, self.r, phi, angle, self.app.options['vehicleWidth'])
-		# @2024_04_01_1139 add helth info of selected vehicle
-		if self.selected:
-			self.app.canvas.create_text(16, 16, text=str(round(self.health, 2)), fill='white', font=('Arial', 16), anchor=NW)
+		self.app.drawVehicle(self.pos, self.velocity, self.dna, self.health, self.selected)
 
 	def boundaries(self):
 		d = 25
@@ -300,6 +240,224 @@ class Vehicle:
 			steer = desired.sub(self.velocity).limit(self.maxforce)
 			self.applyForce(steer)
 
+class FoodGrid:
+	"""Food or poison positions (Vectors) hashed into square cells of the screen
+		to find them near a vehicle without looking through all of them.
+		Every position has its circle on the canvas while it is in the grid"""
+	def __init__(self, app, radius, color, cellSize=50):
+		self.app = app
+		self.radius = radius
+		self.color = color
+		# Canvas items by positions
+		self.items = {}
+		self.cellSize = cellSize
+		# Cells by (column, row) as dicts of positions to their serial numbers
+		self.cells = {}
+		self.count = 0
+		self.serial = 0
+
+	def cell(self, pos):
+		return int(pos.x // self.cellSize), int(pos.y // self.cellSize)
+
+	def add(self, pos):
+		self.cells.setdefault(self.cell(pos), {})[pos] = self.serial
+		self.serial += 1
+		self.count += 1
+		self.items[pos] = self.app.create_circle(pos.x, pos.y, self.radius, fill=self.color)
+
+	def remove(self, pos):
+		key = self.cell(pos)
+		cell = self.cells[key]
+		del cell[pos]
+		if not cell: del self.cells[key]
+		self.count -= 1
+		self.app.canvas.delete(self.items.pop(pos))
+
+	def near(self, pos, radius):
+		"""Return list of positions from cells within radius around pos.
+			The last added go first as if we walked a list of all positions backwards,
+			so vehicles choose the same one of equally distant targets"""
+		col, row = self.cell(pos)
+		n = math.ceil(radius / self.cellSize)
+		items = []
+		for i in range(col - n, col + n + 1):
+			for j in range(row - n, row + n + 1):
+				cell = self.cells.get((i, j))
+				if cell: items.extend(cell.items())
+		return self.newestFirst(items)
+
+	def entries(self):
+		"""Return list of all (position, serial) pairs in no particular order"""
+		return [item for cell in self.cells.values() for item in cell.items()]
+
+	@staticmethod
+	def newestFirst(items):
+		"""Order (position, serial) pairs by serial from the last and return positions"""
+		items.sort(key=lambda item: item[1], reverse=True)
+		return [item[0] for item in items]
+
+	def __len__(self): return self.count
+
+class Population:
+	"""All vehicles at once as NumPy arrays of positions, velocities, DNA and health.
+		Steering, health decay, cloning and death are computed for all of them in
+		vectorised steps with the same rules as Vehicle objects follow.
+		Note: unlike scalar engine all vehicles look for food before any of them moves.
+		When several vehicles reach the same food the first of them eats it"""
+	def __init__(self, app):
+		self.app = app
+		self.maxspeed = 5
+		self.maxforce = 0.5
+		# Random generator seeded from random module so that random.seed() rules both engines
+		self.rng = np.random.default_rng(random.getrandbits(32))
+		self.pos = np.zeros((0, 2))
+		self.vel = np.zeros((0, 2))
+		self.dna = np.zeros((0, 4))
+		self.health = np.zeros(0)
+		self.selected = np.zeros(0, dtype=bool)
+
+	def __len__(self): return len(self.health)
+
+	def add(self, pos, dna=None):
+		"""Add vehicles at positions @pos ((k, 2) array) with random DNA
+			or mutated copies of @dna ((k, 4) array) when cloning"""
+		k = len(pos)
+		vel = self.rng.integers(-2, 2, (k, 2), endpoint=True)
+		if dna is None:
+			dna = np.column_stack((
+				# Food and poison weights
+				self.rng.integers(-2, 2, (k, 2), endpoint=True),
+				# Food and poison perceptions
+				self.rng.integers(0, 100, (k, 2), endpoint=True)))
+		else:
+			# Mutation with the same magic rate of 0.01 as in Vehicle
+			delta = np.column_stack((
+				self.rng.uniform(-0.1, 0.1, (k, 2)),
+				self.rng.integers(-10, 10, (k, 2), endpoint=True)))
+			dna = dna + np.where(self.rng.random((k, 4)) < 0.01, delta, 0)
+		self.pos = np.concatenate((self.pos, pos))
+		self.vel = np.concatenate((self.vel, vel))
+		self.dna = np.concatenate((self.dna, dna))
+		self.health = np.concatenate((self.health, np.ones(k)))
+		self.selected = np.concatenate((self.selected, np.zeros(k, dtype=bool)))
+
+	def limit(self, v, limit):
+		"""Limit magnitudes of vectors in (n, 2) array @v by @limit"""
+		mag = np.hypot(v[:, 0], v[:, 1])
+		scale = np.where(mag > limit, limit / np.where(mag > 0, mag, 1), 1)
+		return v * scale[:, None]
+
+	def boundaries(self):
+		"""Steering forces of vehicles which are too close to the edges"""
+		d, ms = 25, self.maxspeed
+		x, y = self.pos[:, 0], self.pos[:, 1]
+		vx, vy = self.vel[:, 0], self.vel[:, 1]
+		# As in Vehicle.boundaries vertical edges take precedence over horizontal ones
+		nearX = (x < d) | (x > self.app.w - d)
+		nearY = (y < d) | (y > self.app.h - d)
+		desired = np.column_stack((
+			np.where(nearY, vx, np.where(x < d, ms, -ms)),
+			np.where(nearY, np.where(y < d, ms, -ms), vy)))
+		steer = self.limit(desired - self.vel, self.maxforce)
+		steer[~(nearX | nearY)] = 0
+		return steer
+
+	def pairs(self, target, radius, cellSize):
+		"""Return indices of vehicles and @target positions for all pairs where target is
+			in a cell of cellSize within @radius of the vehicle, as FoodGrid.near does.
+			Targets are sorted by their cells and every cell is found with a binary search"""
+		if not len(self): return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+		# Pack (column, row) into one integer key, cells can be left or above the screen too
+		def key(col, row): return (col + 2 ** 20) * 2 ** 21 + row + 2 ** 20
+		cells = np.floor(target / cellSize).astype(np.int64)
+		order = np.argsort(key(cells[:, 0], cells[:, 1]), kind='stable')
+		keys = key(cells[order, 0], cells[order, 1])
+		own = np.floor(self.pos / cellSize).astype(np.int64)
+		span = np.ceil(radius / cellSize).astype(np.int64)
+		vehicles, starts, counts = [], [], []
+		top = int(span.max())
+		for i in range(-top, top + 1):
+			for j in range(-top, top + 1):
+				rows = np.flatnonzero((span >= abs(i)) & (span >= abs(j)))
+				cell = key(own[rows, 0] + i, own[rows, 1] + j)
+				lo, hi = np.searchsorted(keys, cell, 'left'), np.searchsorted(keys, cell, 'right')
+				found = hi > lo
+				vehicles.append(rows[found])
+				starts.append(lo[found])
+				counts.append((hi - lo)[found])
+		vehicles, starts, counts = np.concatenate(vehicles), np.concatenate(starts), np.concatenate(counts)
+		# Expand (start, count) ranges into indices of sorted targets
+		shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+		return np.repeat(vehicles, counts), order[shift + np.arange(counts.sum())]
+
+	def eat(self, foodpois, nutrition, perception):
+		"""Eat food/poison from @foodpois (FoodGrid) within reach and
+			return steering forces towards the closest ones within @perception"""
+		n = len(self)
+		steer = np.zeros((n, 2))
+		entries = foodpois.entries()
+		if not entries: return steer
+		items = [item for item, _ in entries]
+		target = np.array([(item.x, item.y) for item in items])
+		serial = np.array([serial for _, serial in entries])
+		# Only items within eating distance or perception matter
+		v, t = self.pairs(target, np.maximum(perception, self.maxspeed), foodpois.cellSize)
+		dist = np.hypot(self.pos[v, 0] - target[t, 0], self.pos[v, 1] - target[t, 1])
+		# Every item is eaten by the first vehicle which reaches it
+		reach = dist < self.maxspeed
+		eater = np.full(len(items), n)
+		np.minimum.at(eater, t[reach], v[reach])
+		eaten = eater < n
+		self.health += nutrition * np.bincount(eater[eaten], minlength=n)
+		for i in np.flatnonzero(eaten).tolist():
+			foodpois.remove(items[i])
+		# Seek the closest of the rest, the newest of equally distant ones as in Vehicle.eat
+		seen = ~eaten[t] & (dist < perception[v])
+		v, t, dist = v[seen], t[seen], dist[seen]
+		best = np.lexsort((-serial[t], dist, v))
+		v, first = np.unique(v[best], return_index=True)
+		t = t[best[first]]
+		# As Vehicle.seek does (its setMag does not change desired vector)
+		steer[v] = self.limit(target[t] - self.pos[v] - self.vel[v], self.maxforce)
+		return steer
+
+	def step(self):
+		"""Steer and move all vehicles. Called on every frame"""
+		acc = self.boundaries()
+		acc += self.eat(self.app.food, 0.2, self.dna[:, 2]) * self.dna[:, 0, None]
+		acc += self.eat(self.app.poison, -1, self.dna[:, 3]) * self.dna[:, 1, None]
+		self.health -= 0.005
+		self.vel = self.limit(self.vel + acc, self.maxspeed)
+		self.pos += self.vel
+
+	def draw(self):
+		for (x, y), (vx, vy), dna, health, selected in zip(self.pos.tolist(), self.vel.tolist(),
+				self.dna.tolist(), self.health.tolist(), self.selected.tolist()):
+			self.app.drawVehicle(Vector(x, y), Vector(vx, vy), dna, health, selected)
+
+	def evolve(self):
+		"""Clone lucky vehicles while there is room for them and turn dead ones into graves"""
+		n = len(self)
+		born = np.flatnonzero(self.rng.random(n) < 0.005)[:max(self.app.options['vehicles'] - n, 0)]
+		pos, dna = self.pos[born], self.dna[born]
+		dead = self.health <= 0
+		if dead.any():
+			# When vehicle is dead place food or poison in its place as a grave)
+			for (x, y), food in zip(self.pos[dead].tolist(), (self.rng.integers(1, 10, int(dead.sum()), endpoint=True) < 7).tolist()):
+				(self.app.food if food else self.app.poison).add(Vector(x, y))
+			alive = ~dead
+			self.pos, self.vel, self.dna = self.pos[alive], self.vel[alive], self.dna[alive]
+			self.health, self.selected = self.health[alive], self.selected[alive]
+		if len(born): self.add(pos, dna)
+
+	def select(self, x, y, radius):
+		"""Select only the nearest vehicle to x, y if it is within radius"""
+		self.selected[:] = False
+		if len(self):
+			dist = np.hypot(self.pos[:, 0] - x, self.pos[:, 1] - y)
+			i = dist.argmin()
+			if dist[i] < radius: self.selected[i] = True
+
 class Main:
 	"""Main canvas class where all animation occurs"""
 	def __init__(self, canvas, options):
@@ -323,8 +481,7 @@ class Main:
 		self.canvas.bind('<Configure>', self.resize)
 		self.canvas.bind('<Destroy>', self.game_over)
 		# Gradient colors for vehicles depepend on their dna information
-		colors = GradientColor.linear_gradient(self.options['poisonColor'], self.options['foodColor'], 101)
-		self.colors = list(colors['hex'])
+		self.colors = gradient(self.options['poisonColor'], self.options['foodColor'], 101).hex
 		self.foodRadius = self.options['foodRadius']
 		self.poisonRadius = self.options['poisonRadius']
 		# Init animation first time
@@ -332,6 +489,8 @@ class Main:
 	def selectVehicle(self, evt):
 		"""Selects vehicle under mouse cursor position to see its debug information
 		@2024_04_01_1032 added by Beotiger and co."""
+		if self.engine is not None:
+			return self.engine.select(evt.x, evt.y, self.options['vehicleRadius'] * 2)
 		mousePos = Vector(evt.x, evt.y)
 		min = 100000
 		vehicle = -1
@@ -345,6 +504,39 @@ class Main:
 		if vehicle >= 0 and self.vehicles[vehicle].pos.dist(mousePos) < self.options['vehicleRadius'] * 2:
 			self.vehicles[vehicle].selected = 1
 
+	def drawVehicle(self, pos, velocity, dna, health, selected):
+		"""Draw a vehicle at pos moving with velocity. It is used by both Vehicle objects and Population"""
+		# Draw a triangle rotated in the direction of velocity
+		heading = velocity.heading()
+		angle = math.degrees(heading) + 90 # + math.pi / 2
+		# print(f'Velocity={velocity}')
+		# print(f'angle={round(angle, 1)}°')
+		# vehicle radius
+		"""push()
+		translate(pos.x, pos.y)
+		rotate(angle)"""
+		if self.options['debug'] or selected:
+			# Radians start counting from east not north side of the circle
+			rangle = math.radians(angle) + math.pi / 2
+			fc = self.options['foodColor']
+			pc = self.options['poisonColor']
+			self.drawLine(fc, pos.x, pos.y, pos.x, pos.y - dna[0] * 25, rangle, width=3, tags='vehicle')
+			self.create_circle(pos.x, pos.y, dna[2] * 2, outline=fc, width=2, tags='vehicle')
+			self.drawLine(pc, pos.x, pos.y, pos.x, pos.y - dna[1] * 25, rangle, width=2, tags='vehicle')
+			self.create_circle(pos.x, pos.y, dna[3] * 2, outline=pc, width=2, tags='vehicle')
+
+		hlt = int(health * 100) % 101
+		color = self.colors[hlt]
+		# Shrink vehicles angle when they are too fast
+		phi = self.options['vehicleAngle']
+		if self.options['shrink']: phi -= velocity.mag() * 5
+		if phi < 5: phi = 5 # 5 degrees is a minimum
+		# Angle of our triangle in degrees
+		self.drawTri(color, pos.x, pos.y, self.options['vehicleRadius'], phi, angle, self.options['vehicleWidth'])
+		# @2024_04_01_1139 add helth info of selected vehicle
+		if selected:
+			self.canvas.create_text(16, 16, text=str(round(health, 2)), fill='white', font=('Arial', 16), anchor=NW, tags='vehicle')
+
 	# Some Tk canvas draw primitives wrappers
 	def drawLine(self, color, x1, y1, x2, y2, angle=0.0, **kwargs):
 		"""Draw a line on the canvas with specified color"""
@@ -364,8 +556,8 @@ class Main:
 		phi - angle between two lines, di - angle to the target
 		Angles are in degrees here"""
 		x1, y1 = x, y + r * 2
-		self.drawLine(color, x, y, x1, y1, math.radians(phi + di) + math.pi / 2, width=width)
-		self.drawLine(color, x, y, x1, y1, math.radians(-phi + di) + math.pi / 2, width=width)
+		self.drawLine(color, x, y, x1, y1, math.radians(phi + di) + math.pi / 2, width=width, tags='vehicle')
+		self.drawLine(color, x, y, x1, y1, math.radians(-phi + di) + math.pi / 2, width=width, tags='vehicle')
 	# Some events bindings
 	def toggle_fullscreen(self, evt=None):
 			"""Toggle full screen mode"""
@@ -401,59 +593,77 @@ class Main:
 	def addVehicle(self, evt):
 		"""Add new vehicle (on left mouse click as a rule)"""
 		# coord = self.randXY()
-		self.vehicles.append(Vehicle(self, evt.x, evt.y))
+		if self.engine is not None:
+			self.engine.add(np.array([(evt.x, evt.y)], dtype=float))
+		else:
+			self.vehicles.append(Vehicle(self, evt.x, evt.y))
 
 	def init(self):
 		"""Initialise vehicles"""
 		# Store new width/height of the canvas
 		self.w, self.h = self.canvas.winfo_width(), self.canvas.winfo_height()
 		self.vehicles = []
-		self. food = []
-		self.poison = []
+		# Remove food and poison of previous game
+		self.canvas.delete(ALL)
+		self.food = FoodGrid(self, self.foodRadius, self.options['foodColor'])
+		self.poison = FoodGrid(self, self.poisonRadius, self.options['poisonColor'])
 		# Create vehicles, food and posions
+		# Fall back to scalar engine when NumPy is not installed
+		self.engine = Population(self) if self.options['engine'] == 'array' and np is not None else None
 		for _ in range(self.options['vehicles']):
 			coord = self.randXY()
-			self.vehicles.append(Vehicle(self, coord.x, coord.y))
+			if self.engine is not None:
+				self.engine.add(np.array([(coord.x, coord.y)], dtype=float))
+			else:
+				self.vehicles.append(Vehicle(self, coord.x, coord.y))
 		for _ in range(self.options['food']):
-			self.food.append(self.randXY())
+			self.food.add(self.randXY())
 		for _ in range(self.options['poison']):
-			self.poison.append(self.randXY())
-		self.update()
+			self.poison.add(self.randXY())
+		self.render()
 
-	def update(self):
-		"""Main update routine"""
+	def step(self, dt):
+		"""Spawn food and poison, steer vehicles and let them breed and die"""
 		if self.running:
-			# Clear canvas
-			self.canvas.delete(ALL)
 			# Chance to spawn more food and posion
 			if len(self.food) < self.options['food'] and random.random() < 0.1:
-				self.food.append(self.randXY())
+				self.food.add(self.randXY())
 			if len(self.poison) < self.options['poison'] and random.random() < 0.1:
-				self.poison.append(self.randXY())
-			# Draw food and poison as circles in 4px radius
-			for i in range(len(self.food)):
-				self.create_circle(self.food[i].x, self.food[i].y, self.foodRadius, fill=self.options['foodColor'])
-			for i in range(len(self.poison)):
-				self.create_circle(self.poison[i].x, self.poison[i].y, self.poisonRadius, fill=self.options['poisonColor'])
+				self.poison.add(self.randXY())
+			if self.engine is not None:
+				alive = len(self.engine)
+				self.engine.step()
+				self.engine.evolve()
+				# If we lost last one start anew
+				if alive and len(self.engine) < 1:
+					self.init()
 			for v in self.vehicles[:]:
 				v.boundaries()
 				v.behaviors(self.food, self.poison)
 				v.update()
-				v.draw()
 				newVehicle = v.clone()
 				if len(self.vehicles) < self.options['vehicles'] and newVehicle is not None:
 					self.vehicles.append(newVehicle)
 				# When vehicle is dead place food or poison in its place as a grave)
 				if v.dead():
 					if random.randint(1, 10) < 7:
-						self.food.append(Vector(v.pos.x, v.pos.y))
+						self.food.add(Vector(v.pos.x, v.pos.y))
 					else:
-						self.poison.append(Vector(v.pos.x, v.pos.y))
+						self.poison.add(Vector(v.pos.x, v.pos.y))
 					self.vehicles.remove(v)
 					# If we lost last one start anew
 					if len(self.vehicles) < 1:
 						self.init()
 
+	def render(self):
+		"""Draw vehicles anew. Food and poison stay on the canvas till eaten"""
+		if self.running:
+			self.canvas.delete('vehicle')
+			if self.engine is not None:
+				self.engine.draw()
+			for v in self.vehicles:
+				v.draw()
+
 class TkScreenSaver:
 	"""Screensaver"""
 	def __init__(self, scrsaver, options, timer=0):
@@ -468,20 +678,14 @@ class TkScreenSaver:
 													bd=0, relief='ridge', highlightthickness=0, cursor='none')
 		self.canvas.pack()
 		self.animate = Main(self.canvas, options)
-		self.run()
-
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move"""
-		self.animate.update()
-		self.root.update_idletasks()
-		self.root.update()
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.animate.step, self.animate.render)
 
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.animate.running = False
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.root.destroy()
 
 class App:
@@ -496,20 +700,14 @@ class App:
 		self.canvas = Canvas(self.win, width=WIDTH, height=HEIGHT)
 		self.canvas.pack()
 		self.animate = Main(self.canvas, options)
-		self.run()
+		self.scheduler = Scheduler(self.win)
+		self.scheduler.start(self.animate.step, self.animate.render)
 		self.win.mainloop()
 
-	def run(self, evt=None):
-		"""Run animation while not window closed or ESC key pressed"""
-		self.animate.update()
-		self.win.update_idletasks()
-		self.win.update()
-		self.afterId = self.win.after(25, self.run)
-
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close window"""
 		self.animate.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Test application if not in module mode
@@ -13,6 +13,13 @@ Use left mouse button to restart drawing or Space bar key to pause it
 import random
 import math
 from tkinter import *
+try:
+	from ._colors import gradient
+	from ._scheduler import Scheduler
+except ImportError:
+	# Running as a script from screensavers folder
+	from _colors import gradient
+	from _scheduler import Scheduler
 
 # Default width and height of canvas when testing screensaver.
 # Adjust them to your needs
@@ -44,53 +51,6 @@ app_options = {
 	'timer': 10
 }
 
-class GradientColor:
-	@staticmethod
-	def hex_to_RGB(hex):
-		""" "#FFFFFF" -> [255,255,255] """
-		# Pass 16 to the integer function for change of base
-		return [int(hex[i:i+2], 16) for i in range(1, 6, 2)]
-
-	@staticmethod
-	def RGB_to_hex(RGB):
-		""" [255,255,255] -> "#FFFFFF" """
-		# Components need to be integers for hex to make sense
-		RGB = [int(x) for x in RGB]
-		return "#"+"".join(["0{0:x}".format(v) if v < 16 else
-							"{0:x}".format(v) for v in RGB])
-
-	@staticmethod
-	def color_dict(gradient):
-		""" Takes in a list of RGB sub-lists and returns dictionary of
-			colors in RGB and hex form for use in a graphing function
-			defined later on """
-		return {"hex":[GradientColor.RGB_to_hex(RGB) for RGB in gradient],
-				"r":[RGB[0] for RGB in gradient],
-				"g":[RGB[1] for RGB in gradient],
-				"b":[RGB[2] for RGB in gradient]}
-
-	@staticmethod
-	def linear_gradient(start_hex, finish_hex="#FFFFFF", n=10):
-		""" returns a gradient list of (n) colors between
-			two hex colors. start_hex and finish_hex
-			should be the full six-digit color string,
-			inlcuding the number sign ("#FFFFFF") """
-		# Starting and ending colors in RGB form
-		s = GradientColor.hex_to_RGB(start_hex)
-		f = GradientColor.hex_to_RGB(finish_hex)
-		# Initilize a list of the output colors with the starting color
-		RGB_list = [s]
-		# Calcuate a color at each evenly spaced value of t from 1 to n
-		for t in range(1, n):
-			# Interpolate RGB vector for color at the current value of t
-			curr_vector = [
-				int(s[j] + (float(t)/(n-1))*(f[j]-s[j]))
-				for j in range(3)
-			]
-			# Add it to our list of output colors
-			RGB_list.append(curr_vector)
-		return GradientColor.color_dict(RGB_list)
-
 class Point:
 	def __init__(self, app, x, y, ang, rad):
 		self.app = app
@@ -110,7 +70,7 @@ class Point:
 		# color = self.app.lerpColor(startColor, endColor, self.app.map(self.rad, self.app.options['startRad'], 0, 0, 1))
 		# rgb = '#' + '' . join(f'{i:02X}' for i in color)
 		rgb = self.app.colors[int(self.rad * 2)]
-		self.app.circle(rgb, self.x, self.y, self.rad * 2, width=0)
+		self.app.disc(rgb, self.x, self.y, self.rad * 2)
 
 class Main:
 	"""Main canvas class where all animation occurs"""
@@ -162,6 +122,17 @@ class Main:
 		"""Draw circle at x,y coords with radius r, kwargs - more optional Tk parameters.
 				This version uses translation"""
 		return self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=color, **kwargs)
+	def disc(self, color, x, y, r):
+		"""Paint filled circle at x,y coords with radius r into tentacles image.
+			It is painted row by row with photo image put commands collected in self.script"""
+		top, bottom = max(int(y - r), 0), min(int(y + r) + 1, self.h)
+		for row in range(top, bottom):
+			dy = row + 0.5 - y
+			if dy * dy >= r * r: continue
+			half = math.sqrt(r * r - dy * dy)
+			left, right = max(round(x - half), 0), min(round(x + half), self.w)
+			if left < right:
+				self.script.append(f'{self.image} put {color} -to {left} {row} {right} {row + 1}\n')
 
 	# Some events bindings
 	def toggle_fullscreen(self, evt=None):
@@ -190,6 +161,12 @@ class Main:
 		# Store new width/height of the canvas
 		self.w, self.h = self.canvas.winfo_width(), self.canvas.winfo_height()
 		self.canvas.delete(ALL)
+		# Tentacles are painted into one image so that the canvas has only one item
+		# however long they grow. Its transparent pixels show canvas background
+		self.image = PhotoImage(master=self.canvas, width=self.w, height=self.h)
+		self.canvas.create_image(0, 0, image=self.image, anchor=NW)
+		# Photo image commands to paint current frame
+		self.script = []
 		self.done = False
 		self.points = []
 		TAU = math.pi * 2
@@ -197,21 +174,19 @@ class Main:
 		if self.options['dynamicRad']:
 			self.options['startRad'] = self.h // 20
 		# Use startRad * 2 gradient colors
-		self.colors = GradientColor.linear_gradient(
+		self.colors = gradient(
 			self.options['startColor'],
 			self.options['endColor'],
-			self.options['startRad'] * 2)['hex']
+			self.options['startRad'] * 2).hex
 		# Create starting points to draw into tentacles
 		for _ in range(self.options['num']):
 			self.points.append(Point(self, self.w / 2, self.h / 2, random.uniform(0, TAU), self.options['startRad']))
 		# Start animation
 		self.running = True
 
-	def update(self):
-		"""Main update routine"""
+	def step(self, dt):
+		"""Grow tentacles by one step. Their discs are collected in script and painted by render"""
 		if self.running:
-			# Clear canvas if needed
-			# self.canvas.delete(ALL)
 			if not self.done:
 				for point in self.points:
 					point.update()
@@ -225,6 +200,12 @@ class Main:
 						self.canvas.after_cancel(self.timer)
 					self.timer = self.canvas.after(self.options['timer'] * 1000, self.resize)
 
+	def render(self):
+		"""Paint all discs collected since last frame into the image at once"""
+		if self.script:
+			self.canvas.tk.eval(''.join(self.script))
+			self.script.clear()
+
 class TkScreenSaver:
 	"""Screensaver"""
 	def __init__(self, scrsaver, options, timer=0):
@@ -236,20 +217,14 @@ class TkScreenSaver:
 													bd=0, relief='ridge', highlightthickness=0, cursor='none')
 		self.canvas.pack()
 		self.animate = Main(self.canvas, options)
-		self.run()
-
-	def run(self, evt=None):
-		"""Run animation while not any key pressed or mouse move as a rule"""
-		self.animate.update()
-		self.root.update_idletasks()
-		self.root.update()
-		self.afterId = self.root.after(25, self.run)
+		self.scheduler = scrsaver.scheduler
+		self.scheduler.start(self.animate.step, self.animate.render)
 
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false and close (i.e. destroy) window"""
 		self.animate.running = False
 		if self.timer is not None: self.root.after_cancel(self.timer)
-		self.root.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.root.destroy()
 
 class App:
@@ -264,20 +239,14 @@ class App:
 		self.canvas = Canvas(self.win, width=WIDTH, height=HEIGHT)
 		self.canvas.pack()
 		self.animate = Main(self.canvas, options)
-		self.run()
+		self.scheduler = Scheduler(self.win)
+		self.scheduler.start(self.animate.step, self.animate.render)
 		self.win.mainloop()
 
-	def run(self, evt=None):
-		"""Run animation while not window closed or ESC key pressed"""
-		self.animate.update()
-		self.win.update_idletasks()
-		self.win.update()
-		self.afterId = self.win.after(25, self.run)
-
 	def fin(self, evt=None):
 		"""Finalize animation: set it to false, stop timer and close window"""
 		self.animate.running = False
-		self.win.after_cancel(self.afterId)
+		self.scheduler.stop()
 		self.win.destroy()
 
 # Run only if not in module mode
@@ -0,0 +1,77 @@
+"""
+	Array engine of boids.py against its scalar engine.
+
+	Engines apply the same Reynold's rules, but scalar one moves boids one by one
+	in place while array one moves all of them at once from previous frame state.
+	So a single array step must match scalar rules applied to the previous frame exactly
+	and a few steps of both engines must stay close to each other.
+
+	Run from project folder: python -m unittest discover tests
+"""
+
+import math
+import random
+import unittest
+
+from screensavers import boids
+
+WIDTH, HEIGHT = 1280, 720
+
+class StubCanvas:
+	"""Just enough of Tk canvas for BoidsCanvas: sizes and item ids"""
+	def __init__(self):
+		self.items = 0
+	def winfo_width(self): return WIDTH
+	def winfo_height(self): return HEIGHT
+	def __getattr__(self, name):
+		def call(*args, **kwargs):
+			if name.startswith('create_'):
+				self.items += 1
+				return self.items
+		return call
+
+def flock(seed, engine, **options):
+	"""Return boids canvas with @engine and boids created from random @seed"""
+	random.seed(seed)
+	options = dict(boids.app_options, useChasePoints=False, engine=engine, **options)
+	return boids.BoidsCanvas(StubCanvas(), options)
+
+def positions(canvas):
+	return [(boid.position.x, boid.position.y) for boid in canvas.boids]
+
+def distance(a, b):
+	"""Distance between points on the torus screen"""
+	dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+	return math.hypot(min(dx, WIDTH - dx), min(dy, HEIGHT - dy))
+
+@unittest.skipIf(boids.np is None, 'NumPy is not installed')
+class TestBoidsEngine(unittest.TestCase):
+	def test_step_applies_scalar_rules(self):
+		"""One array step equals scalar update of every boid from the same previous frame"""
+		for seed, options in enumerate([{}, {'colorize': True}, {'mixedSizes': True}]):
+			scalar, array = flock(seed, 'scalar', **options), flock(seed, 'array', **options)
+			state = [(boid.position, boid.velocity) for boid in scalar.boids]
+			scalar.buildGrid()
+			expected = []
+			for boid in scalar.boids:
+				for other, (position, velocity) in zip(scalar.boids, state):
+					other.position = boids.Vector(position.x, position.y)
+					other.velocity = boids.Vector(velocity.x, velocity.y)
+				boid.update()
+				expected.append((boid.position.x, boid.position.y))
+			array.step(1 / 40)
+			for a, b in zip(expected, positions(array)):
+				self.assertLess(distance(a, b), 1e-9)
+
+	def test_short_horizon(self):
+		"""Engines drift apart only slowly as update order differs"""
+		for seed in range(5):
+			scalar, array = flock(seed, 'scalar'), flock(seed, 'array')
+			for _ in range(5):
+				scalar.step(1 / 40)
+				array.step(1 / 40)
+			drift = max(distance(a, b) for a, b in zip(positions(scalar), positions(array)))
+			self.assertLess(drift, 2.5)
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,104 @@
+"""
+	Fire of fire_krasnov.py: NumPy FireField against KrasFire loops,
+	automatic grid calibration and renderer without NumPy.
+
+	Run from project folder: python -m unittest discover tests
+"""
+
+import itertools
+import random
+import unittest
+from unittest import mock
+
+from screensavers import fire_krasnov
+
+class StubCanvas:
+	"""Just enough of Tk canvas for fire Main: sizes and ignored drawing calls"""
+	def __init__(self, width=1280, height=720):
+		self.width, self.height = width, height
+	def winfo_width(self): return self.width
+	def winfo_height(self): return self.height
+	def __getattr__(self, name):
+		return lambda *args, **kwargs: None
+
+def main(**options):
+	"""Return fire Main with @options on stub canvas without running init"""
+	fire = fire_krasnov.Main.__new__(fire_krasnov.Main)
+	fire.canvas = StubCanvas()
+	fire.options = dict(fire_krasnov.app_options, **options)
+	return fire
+
+def master(numx, numy):
+	"""Return stub fire Main with @numx x @numy grid for KrasFire and FireField"""
+	fire = main()
+	fire.numx, fire.numy, fire.fade = numx, numy, fire_krasnov.FADE
+	fire.w, fire.h = fire.canvas.width, fire.canvas.height
+	return fire
+
+def colors(fire):
+	"""Return KrasFire cells as array of shape (3, numy, numx) as in FireField"""
+	return fire_krasnov.np.array([[[getattr(fire.Fire[i][j], c) for i in range(fire.numx)]
+		for j in range(fire.numy)] for c in 'rgb'])
+
+class SlowField:
+	"""FireField stand-in which never gets fast enough, fails instead of hanging"""
+	built = 0
+	def __init__(self, master):
+		SlowField.built += 1
+		if SlowField.built > 100: raise RuntimeError('autoFire does not stop')
+		self.item = None
+	def StepFire(self): pass
+	def DrawFire(self): pass
+
+@unittest.skipIf(fire_krasnov.np is None, 'NumPy is not installed')
+class TestFireField(unittest.TestCase):
+	def test_matches_krasfire(self):
+		"""A few FireField steps equal KrasFire steps from the same bottom rows"""
+		np = fire_krasnov.np
+		# Grid widths around MIXBLOCK multiples check blocked mixing of rows
+		for numx, numy in [(50, 50), (37, 23), (3, 3), (fire_krasnov.MIXBLOCK + 1, 5), (65, 9)]:
+			random.seed(numx)
+			with mock.patch.object(fire_krasnov, 'PhotoImage'):
+				field = fire_krasnov.FireField(master(numx, numy))
+			fire = fire_krasnov.KrasFire(master(numx, numy))
+			for _ in range(numy + 5):
+				fire.FireUp()
+				field.FireUp()
+				fire.SetFire()
+				field.PreF = np.array([[getattr(col, c) for col in fire.PreF] for c in 'rgb'])
+				fire.MixFire()
+				field.MixFire()
+				self.assertTrue(np.allclose(colors(fire), field.Fire))
+
+class TestFireGrid(unittest.TestCase):
+	def setUp(self):
+		fire_krasnov.autoGrids.clear()
+		SlowField.built = 0
+
+	@unittest.skipIf(fire_krasnov.np is None, 'NumPy is not installed')
+	def test_auto_stops_at_floor_with_fixed_dimension(self):
+		"""Calibration stops when automatic dimension reaches its floor even if fixed one is large"""
+		for options, grid in [({'gridWidth': 0, 'gridHeight': 200}, (fire_krasnov.NUMX, 200)),
+				({'gridWidth': 200, 'gridHeight': 0}, (200, fire_krasnov.NUMY)),
+				({'gridWidth': 0, 'gridHeight': 0}, (fire_krasnov.NUMX, fire_krasnov.NUMY))]:
+			fire_krasnov.autoGrids.clear()
+			# Every perf_counter() call is one second later, i.e. every frame is too slow
+			with mock.patch.object(fire_krasnov, 'FireField', SlowField), \
+					mock.patch('time.perf_counter', side_effect=itertools.count()):
+				fire = main(**options)
+				fire.init()
+			self.assertIsInstance(fire.fire, SlowField)
+			self.assertEqual((fire.numx, fire.numy), grid)
+
+	def test_rectangles_use_default_grid(self):
+		"""Without NumPy configured grid is ignored and KrasFire uses NUMX x NUMY"""
+		for options in [{'gridWidth': 200, 'gridHeight': 150}, {'gridWidth': 30, 'gridHeight': 0}]:
+			with mock.patch.object(fire_krasnov, 'np', None):
+				fire = main(**options)
+				with self.assertLogs(fire_krasnov.logger, 'WARNING'):
+					fire.init()
+			self.assertIsInstance(fire.fire, fire_krasnov.KrasFire)
+			self.assertEqual((fire.fire.numx, fire.fire.numy), (fire_krasnov.NUMX, fire_krasnov.NUMY))
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,114 @@
+"""
+	Array engine (Population) of steering.py against its scalar engine (Vehicle objects).
+
+	Population applies the same rules as Vehicle but all vehicles look for food before
+	any of them moves. So a Population step must equal scalar updates from the same state
+	when no two vehicles compete for the same food or poison,
+	and array runs must be reproducible under a fixed seed.
+
+	Run from project folder: python -m unittest discover tests
+"""
+
+import math
+import random
+import unittest
+
+from screensavers import steering
+
+WIDTH, HEIGHT = 1280, 720
+
+class StubCanvas:
+	"""Just enough of Tk canvas for steering Main: sizes and item ids"""
+	def __init__(self):
+		self.items = 0
+	def winfo_width(self): return WIDTH
+	def winfo_height(self): return HEIGHT
+	def __getattr__(self, name):
+		def call(*args, **kwargs):
+			if name.startswith('create_'):
+				self.items += 1
+				return self.items
+		return call
+
+def game(seed, **options):
+	"""Return steering Main with array engine started from random @seed"""
+	random.seed(seed)
+	return steering.Main(StubCanvas(), dict(steering.app_options, engine='array', **options))
+
+def state(main):
+	"""Return vehicles and food and poison positions of @main as plain lists"""
+	engine = main.engine
+	grids = [sorted((pos.x, pos.y, serial) for pos, serial in grid.entries()) for grid in (main.food, main.poison)]
+	return engine.pos.tolist(), engine.vel.tolist(), engine.dna.tolist(), engine.health.tolist(), grids
+
+def positions(grid):
+	"""Return sorted coordinates of food or poison in @grid"""
+	return sorted((pos.x, pos.y) for pos, _ in grid.entries())
+
+@unittest.skipIf(steering.np is None, 'NumPy is not installed')
+class TestSteeringEngine(unittest.TestCase):
+	def test_reproducible(self):
+		"""Array runs with the same seed give the same vehicles, food and poison"""
+		def run(seed):
+			# Main uses random module too, so every run goes from seed to its end on its own
+			main = game(seed, vehicles=30)
+			for _ in range(150):
+				main.step(1 / 40)
+			return state(main)
+		for seed in range(3):
+			self.assertEqual(run(seed), run(seed))
+
+	def test_step_applies_scalar_rules(self):
+		"""One Population step equals Vehicle updates when vehicles do not compete for items"""
+		np = steering.np
+		for seed in range(5):
+			main = game(seed, vehicles=0, food=0, poison=0)
+			rng = random.Random(seed)
+			# Vehicles are farther from each other than twice the largest perception,
+			# one of them is at the left edge to be steered by boundaries
+			spots = [(15, 360), (300, 150), (300, 560), (700, 150), (700, 560), (1100, 360)]
+			main.engine.add(np.array(spots, dtype=float))
+			main.engine.vel = np.array([(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in spots])
+			main.engine.dna = np.array([(rng.uniform(-2, 2), rng.uniform(-2, 2),
+				rng.randint(0, 100), rng.randint(0, 100)) for _ in spots])
+			main.engine.health = np.array([rng.uniform(0.1, 1) for _ in spots])
+			food = steering.FoodGrid(main, main.foodRadius, 'green')
+			poison = steering.FoodGrid(main, main.poisonRadius, 'red')
+			# Items around every vehicle, some of them within eating distance
+			for x, y in spots:
+				for k in range(12):
+					r = rng.uniform(0, 4.9) if k < 2 else rng.uniform(5, 110)
+					phi = rng.uniform(0, 2 * math.pi)
+					pos = (x + r * math.cos(phi), y + r * math.sin(phi))
+					grids = (main.food, food) if k % 3 else (main.poison, poison)
+					for grid in grids:
+						grid.add(steering.Vector(*pos))
+			vehicles = []
+			for i, (x, y) in enumerate(spots):
+				v = steering.Vehicle(main, x, y)
+				v.velocity = steering.Vector(*main.engine.vel[i].tolist())
+				v.dna = main.engine.dna[i].tolist()
+				v.health = float(main.engine.health[i])
+				vehicles.append(v)
+			main.engine.step()
+			for v in vehicles:
+				v.boundaries()
+				v.behaviors(food, poison)
+				v.update()
+			expected = [(v.pos.x, v.pos.y, v.velocity.x, v.velocity.y, v.health) for v in vehicles]
+			actual = np.column_stack((main.engine.pos, main.engine.vel, main.engine.health))
+			self.assertTrue(np.allclose(expected, actual, rtol=0, atol=1e-9))
+			for ours, theirs in [(main.food, food), (main.poison, poison)]:
+				self.assertEqual(positions(ours), positions(theirs))
+
+	def test_empty_population(self):
+		"""Without vehicles array engine idles and does not restart the game every frame"""
+		main = game(0, vehicles=0)
+		food = main.food
+		for _ in range(50):
+			main.step(1 / 40)
+		self.assertEqual(len(main.engine), 0)
+		self.assertIs(main.food, food)
+
+if __name__ == '__main__':
+	unittest.main()
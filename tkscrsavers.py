@@ -26,6 +26,8 @@ logging.basicConfig(
 
 # GUI for settings dialog
 import tkscrsavgui
+# Frame scheduler given to every screensaver
+from screensavers._scheduler import Scheduler
 
 # Default settings
 app_name = 'Tk-Screensavers'
@@ -139,6 +141,8 @@ class TkScrSaver:
                 self.win.bind('<Destroy>', self.nextModule)
             # mmm = __import__(name)
             mmm = importlib.import_module('.' + name, 'screensavers')
+            # Screensaver runs its animation frames with this scheduler
+            self.scheduler = Scheduler(self.win)
             mmm.TkScreenSaver(self, opts, timer)
         else:
             # No module is active - just quit peacefully
@@ -159,7 +163,8 @@ class TkScrSaver:
         scrsvr_modules = []
         dir = os.path.join(pathlib.Path(__file__).parent.resolve(), 'screensavers')
         for module in os.listdir(dir):
-            if module != '__init__.py' and module != '_skeleton.py' and module[-3:] == '.py':
+            # Skip package files, _skeleton.py and shared helper modules like _glyphs.py
+            if module[0] != '_' and module[-3:] == '.py':
                 scrsvr_modules.append(module[:-3])
         return sorted(scrsvr_modules)
 